@@ -0,0 +1,58 @@
+"""Micro-benchmark : comparaison tolérante des réponses aux missions 1 et 2.
+
+Pour des réponses typiques (exacte, accentuée, avec article, au pluriel,
+avec une faute de frappe, fausse), affiche ce qu'accepterait l'ancien test
+(``answer.lower().strip() in [...]``, ``"..." in answer.lower()``) et ce
+qu'accepte ``AnswerMatcher``, avec le coût d'une validation.
+
+    python benchmarks/bench_answer_matching.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gaia_core.matching import AnswerMatcher  # noqa: E402
+
+ANSWERS = {
+    1: ["Archipel", "  SUD ", "L'Archipel", "La région Archipel", "archipels", "Arhcipel", "archipl", "Nord", "Est"],
+    2: [
+        "relation inverse",
+        "le CO₂ baisse",
+        "inversement proportionnels",
+        "les émissions baissent",
+        "relation invrese",
+        "ça baïsse",
+        "le CO₂ laisse place",
+        "l'univers",
+        "les deux augmentent",
+        "Les émissions diminuent nettement quand la part renouvelable augmente",
+    ],
+}
+
+OLD = {
+    1: lambda answer: answer.lower().strip() in ["archipel", "sud"],
+    2: lambda answer: "inverse" in answer.lower() or "baisse" in answer.lower(),
+}
+
+
+def per_call_us(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    build = per_call_us(lambda: (AnswerMatcher(["archipel", "sud"]), AnswerMatcher(["inverse", "baisse"], contains=True)), 1000)
+    print(f"construction des deux comparateurs : {build:.1f} µs (une fois par mission)")
+    matchers = {1: AnswerMatcher(["archipel", "sud"]), 2: AnswerMatcher(["inverse", "baisse"], contains=True)}
+    for mission, answers in ANSWERS.items():
+        print(f"Mission {mission}")
+        for answer in answers:
+            old, new = OLD[mission](answer), matchers[mission](answer)
+            cost = per_call_us(lambda: matchers[mission](answer), 2000)
+            print(f"  {answer[:40]:<42} avant {'oui' if old else 'non':<4} après {'oui' if new else 'non':<4} {cost:7.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
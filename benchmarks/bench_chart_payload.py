@@ -0,0 +1,69 @@
+"""Mesure : octets envoyés au navigateur par graphique du tableau de bord.
+
+Pour chacun des six graphiques, compare trois charges utiles sur une même
+sélection : le DataFrame filtré complet en JSON dans la spec (``to_dict``
+d'Altair), le même en Arrow (``st.altair_chart``), et les seules colonnes
+encodées en Arrow (``gaia_core.charts.chart_spec``). Compare enfin le
+total par graphique au total par onglet (``build_tab_specs``), où les deux
+graphiques d'un onglet partagent un seul jeu de données.
+
+Le temps de rendu dans le navigateur n'est pas mesuré ici (pas de
+navigateur) : seuls les octets envoyés le sont.
+
+    python benchmarks/bench_chart_payload.py [--rows 20000]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import altair as alt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_dataset_load import synthetic_dataset  # noqa: E402
+from gaia_core.charts import build_chart_specs, build_tab_specs, payload_bytes  # noqa: E402
+from gaia_core.dataset import SCHEMA, for_display  # noqa: E402
+from gaia_core.filters import FilterIndex  # noqa: E402
+
+
+def inline_json_bytes(spec, frame):
+    """Taille de la spec si le DataFrame complet y était écrit en JSON."""
+    body = {key: value for key, value in spec.items() if key != "datasets"}
+    with alt.data_transformers.enable("default", max_rows=None):
+        values = alt.to_values(frame)
+    return len(json.dumps({**body, "datasets": {"filtered": values["values"]}}, default=str).encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    args = parser.parse_args()
+
+    index = FilterIndex(synthetic_dataset(args.rows).astype(SCHEMA))
+    frame = index.select(index.regions[::2], (2035, 2045))
+    full = build_chart_specs(frame)
+    print(f"{len(frame)} lignes filtrées sur {args.rows}")
+    print(f"  {'graphique':<14} {'JSON complet':>14} {'Arrow complet':>14} {'Arrow réduit':>14}")
+    totals = [0, 0, 0]
+    for name, spec in full.items():
+        body, pruned = payload_bytes(spec)
+        _, complete = payload_bytes({**spec, "datasets": {"filtered": for_display(frame)}})
+        sizes = [inline_json_bytes(spec, for_display(frame)), body + complete, body + pruned]
+        totals = [t + s for t, s in zip(totals, sizes)]
+        print(f"  {name:<14} " + " ".join(f"{s / 1e3:11.1f} ko" for s in sizes))
+    print(f"  {'total':<14} " + " ".join(f"{s / 1e3:11.1f} ko" for s in totals))
+    print(f"  réduction : x{totals[0] / totals[2]:.1f} vs JSON, x{totals[1] / totals[2]:.1f} vs Arrow complet")
+
+    print("\nPar onglet, un jeu de données partagé :")
+    shared = 0
+    for tab, spec in build_tab_specs(frame).items():
+        body, data = payload_bytes(spec)
+        shared += body + data
+        print(f"  {tab:<14} {(body + data) / 1e3:11.1f} ko  (spec {body / 1e3:.1f} ko, données {data / 1e3:.1f} ko)")
+    print(f"  {'total':<14} {shared / 1e3:11.1f} ko  (x{totals[2] / shared:.1f} vs un jeu par graphique)")
+
+
+if __name__ == "__main__":
+    main()
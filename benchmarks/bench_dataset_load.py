@@ -0,0 +1,81 @@
+"""Benchmark : chargement à froid du jeu de données, CSV vs copie Arrow.
+
+Génère un CSV synthétique aux 12 colonnes de ``better_gaia_dataset.csv``
+(1 000 000 de lignes par défaut), puis compare ``pd.read_csv`` au
+chargement par la copie Arrow IPC mappée en mémoire de ``gaia_core.dataset``.
+
+    python benchmarks/bench_dataset_load.py [--rows 1000000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gaia_core.dataset import _load_csv, _read_typed_csv  # noqa: E402
+
+
+def synthetic_dataset(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    years = np.arange(2030, 2051)
+    regions = np.array([f"Region_{i:05d}" for i in range(-(-rows // len(years)))])
+    df = pd.DataFrame({
+        "Region": np.repeat(regions, len(years))[:rows],
+        "Year": np.tile(years, len(regions))[:rows],
+    })
+    for name, low, high, decimals in [
+        ("CO2_ppm", 390, 430, 2),
+        ("Deforestation_pct", 5, 45, 2),
+        ("SeaLevel_cm", 5, 20, 2),
+        ("Temp_anomaly_C", 0.5, 3, 3),
+        ("Population_millions", 5, 60, 3),
+        ("GDP_per_capita_USD", 5000, 50000, 2),
+        ("Renewable_share_pct", 5, 40, 2),
+        ("Industrial_index_0_100", 20, 70, 2),
+        ("Emissions_tCO2_per_capita_est", 0.1, 2, 3),
+        ("Vulnerability_index_0_100", 0, 40, 2),
+    ]:
+        df[name] = rng.uniform(low, high, rows).round(decimals)
+    return df
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["GAIA_CACHE_DIR"] = os.path.join(tmp, "cache")
+        csv_path = os.path.join(tmp, "dataset.csv")
+        synthetic_dataset(args.rows).to_csv(csv_path, index=False)
+        print(f"{args.rows} lignes, CSV de {os.path.getsize(csv_path) / 1e6:.1f} Mo")
+
+        csv_time, expected = timed(lambda: _read_typed_csv(csv_path))
+        start = time.perf_counter()
+        _load_csv(csv_path)  # premier chargement : parse + écriture de la copie
+        build_time = time.perf_counter() - start
+        sidecar_time, loaded = timed(lambda: _load_csv(csv_path))
+        pd.testing.assert_frame_equal(expected, loaded)
+
+        print(f"  pd.read_csv (typé)        {csv_time * 1000:8.1f} ms")
+        print(f"  1er chargement (+ copie)  {build_time * 1000:8.1f} ms")
+        print(f"  copie Arrow mappée        {sidecar_time * 1000:8.1f} ms  (x{csv_time / sidecar_time:.1f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Rapport mémoire : types par défaut vs schéma compact de ``gaia_core.dataset``.
+
+Compare l'empreinte mémoire et le temps du filtre de la barre latérale
+(``isin`` + ``between``) entre ``pd.read_csv`` brut et le schéma typé
+(``Region`` catégorie, ``Year`` int16, indicateurs float32).
+
+    python benchmarks/bench_dataset_memory.py [--rows 1000000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_dataset_load import synthetic_dataset  # noqa: E402
+from gaia_core.dataset import _read_typed_csv  # noqa: E402
+
+
+def sidebar_filter(df, regions):
+    return df[(df["Region"].isin(regions)) & (df["Year"].between(2035, 2045))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "dataset.csv")
+        synthetic_dataset(args.rows).to_csv(csv_path, index=False)
+        frames = {"défaut": pd.read_csv(csv_path), "schéma": _read_typed_csv(csv_path)}
+
+    regions = frames["défaut"]["Region"].drop_duplicates().sample(frac=0.5, random_state=0).tolist()
+    print(f"{args.rows} lignes, {len(regions)} régions sélectionnées")
+    print(f"  {'':<8} {'mémoire':>12} {'filtre':>12}")
+    base = None
+    for label, df in frames.items():
+        mem = df.memory_usage(deep=True).sum() / 1e6
+        seconds = min(timeit.repeat(lambda: sidebar_filter(df, regions), number=5, repeat=3)) / 5
+        base = base or (mem, seconds)
+        print(f"  {label:<8} {mem:9.1f} Mo {seconds * 1000:9.1f} ms   (mémoire x{base[0] / mem:.1f}, filtre x{base[1] / seconds:.1f})")
+    print("\nPar colonne (Mo) :")
+    detail = pd.DataFrame({label: df.memory_usage(deep=True, index=False) / 1e6 for label, df in frames.items()})
+    print(detail.round(2).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark : nuage Énergies renouvelables vs Vulnérabilité, points vs densité.
+
+Jeu synthétique de ``--regions`` régions × ``--points`` lignes. Mesure le
+temps de ``binned_density`` et les octets de la spec de l'onglet Énergie
+avec un point par ligne, puis avec l'histogramme 2D par région.
+
+    python benchmarks/bench_density.py [--regions 20] [--points 50000] [--bins 40]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gaia_core.charts import build_tab_spec, payload_bytes  # noqa: E402
+from gaia_core.density import binned_density  # noqa: E402
+
+
+def correlated_points(regions, points, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = regions * points
+    renewables = rng.uniform(5, 40, rows)
+    return pd.DataFrame({
+        "Region": pd.Categorical(np.repeat([f"Region_{i:03d}" for i in range(regions)], points)),
+        "Year": np.tile(np.linspace(2030, 2050, points).astype(np.int16), regions),
+        "Renewable_share_pct": renewables.astype(np.float32),
+        "Vulnerability_index_0_100": (70 - renewables + rng.normal(0, 6, rows)).astype(np.float32),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--regions", type=int, default=20)
+    parser.add_argument("--points", type=int, default=50_000)
+    parser.add_argument("--bins", type=int, default=40)
+    args = parser.parse_args()
+
+    df = correlated_points(args.regions, args.points)
+    started = time.perf_counter()
+    cells = binned_density(df, "Renewable_share_pct", "Vulnerability_index_0_100", bins=args.bins)
+    elapsed = time.perf_counter() - started
+    assert cells["count"].sum() == len(df)
+    print(f"{len(df)} points, {args.regions} régions")
+    print(f"  histogramme 2D : {elapsed * 1000:.0f} ms, {len(cells)} cases non vides")
+
+    os.environ["GAIA_SCATTER_MAX_POINTS"] = str(len(df))
+    points = sum(payload_bytes(build_tab_spec(df, "energy")))
+    os.environ["GAIA_SCATTER_MAX_POINTS"] = "0"
+    density = sum(payload_bytes(build_tab_spec(df, "energy")))
+    print(f"  onglet Énergie : {points / 1e6:.1f} Mo -> {density / 1e6:.2f} Mo (x{points / density:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark : sous-échantillonnage min/max des courbes du tableau de bord.
+
+Séries synthétiques denses (``--regions`` régions × ``--points`` lignes,
+marche aléatoire, comme des données mensuelles ou journalières). Mesure le
+temps de ``minmax_downsample`` sur toutes les séries à la fois, les points
+gardés, et les octets de la spec de l'onglet Climat avant et après.
+
+    python benchmarks/bench_downsample.py [--regions 300] [--points 20000] [--max-points 1000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gaia_core.charts import build_tab_spec, payload_bytes  # noqa: E402
+from gaia_core.downsample import minmax_downsample  # noqa: E402
+
+
+def dense_series(regions, points, seed=0):
+    rng = np.random.default_rng(seed)
+    rows = regions * points
+    df = pd.DataFrame({
+        "Region": pd.Categorical(np.repeat([f"Region_{i:04d}" for i in range(regions)], points)),
+        "Year": np.tile(np.linspace(2030, 2050, points).astype(np.int16), regions),
+    })
+    for metric, start in [("CO2_ppm", 400), ("Temp_anomaly_C", 1.5)]:
+        df[metric] = (start + rng.normal(0, 0.01 * start, rows).reshape(regions, points).cumsum(axis=1).ravel()).astype(np.float32)
+    return df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--regions", type=int, default=300)
+    parser.add_argument("--points", type=int, default=20_000)
+    parser.add_argument("--max-points", type=int, default=1000)
+    args = parser.parse_args()
+
+    df = dense_series(args.regions, args.points)
+    started = time.perf_counter()
+    kept = minmax_downsample(df, ["CO2_ppm", "Temp_anomaly_C"], args.max_points)
+    elapsed = time.perf_counter() - started
+    per_series = kept.groupby("Region", observed=True).size()
+    extremes = df.groupby("Region", observed=True)["CO2_ppm"].agg(["min", "max"])
+    assert extremes.equals(kept.groupby("Region", observed=True)["CO2_ppm"].agg(["min", "max"]))
+    print(f"{len(df)} lignes ({args.regions} séries × {args.points} points)")
+    print(f"  min/max : {elapsed * 1000:.0f} ms, {len(kept)} lignes gardées (max {per_series.max()} par série)")
+
+    full = sum(payload_bytes(build_tab_spec(df, "climate", max_points=len(df))))
+    reduced = sum(payload_bytes(build_tab_spec(df, "climate", max_points=args.max_points)))
+    print(f"  onglet Climat : {full / 1e6:.1f} Mo -> {reduced / 1e6:.2f} Mo (x{full / reduced:.0f})")
+
+
+if __name__ == "__main__":
+    main()
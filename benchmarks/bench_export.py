@@ -0,0 +1,41 @@
+"""Benchmark : taille et temps de l'export des données filtrées par format.
+
+Compare l'ancien ``to_csv`` d'un bloc aux formats de ``gaia_core.export``
+(CSV par blocs, CSV gzip, Parquet, Arrow IPC) sur un jeu synthétique au
+schéma compact.
+
+    python benchmarks/bench_export.py [--rows 1000000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_dataset_load import synthetic_dataset  # noqa: E402
+from gaia_core.dataset import SCHEMA  # noqa: E402
+from gaia_core.export import EXPORT_FORMATS, export_bytes  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    df = synthetic_dataset(args.rows).astype(SCHEMA)
+    print(f"{args.rows} lignes")
+    print(f"  {'format':<22} {'taille':>12} {'temps':>10}")
+    started = time.perf_counter()
+    baseline = len(df.to_csv(index=False).encode("utf-8"))
+    print(f"  {'to_csv (avant)':<22} {baseline / 1e6:9.1f} Mo {time.perf_counter() - started:8.2f} s")
+    for fmt, export_format in EXPORT_FORMATS.items():
+        started = time.perf_counter()
+        size = len(export_bytes(df, fmt))
+        elapsed = time.perf_counter() - started
+        print(f"  {export_format.label:<22} {size / 1e6:9.1f} Mo {elapsed:8.2f} s   (x{baseline / size:.1f} plus petit)")
+
+
+if __name__ == "__main__":
+    main()
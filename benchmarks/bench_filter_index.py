@@ -0,0 +1,80 @@
+"""Benchmark : filtre de la barre latérale, masque booléen vs ``FilterIndex``.
+
+Jeu synthétique déjà trié par (région, année), aux types du schéma compact
+(``Region`` catégorie, ``Year`` int16, indicateurs float32). Pour chaque
+taille, compare le masque ``isin`` + ``between`` aux tranches de
+``gaia_core.filters.FilterIndex`` sur trois sélections : la moitié des
+régions sur 2035-2045, une seule région, et tout le jeu de données.
+
+    python benchmarks/bench_filter_index.py [--rows 1000000 10000000 50000000] [--regions 100] [--metrics 4]
+
+À 50 M de lignes et 4 indicateurs, compter environ 3 Go de mémoire.
+"""
+
+import argparse
+import os
+import sys
+import time
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gaia_core.filters import FilterIndex  # noqa: E402
+
+YEARS = np.arange(2030, 2051, dtype=np.int16)
+
+
+def sorted_dataset(rows, regions, metrics, seed=0):
+    rng = np.random.default_rng(seed)
+    cells = regions * len(YEARS)
+    per_cell = -(-rows // cells)
+    names = [f"Region_{i:04d}" for i in range(regions)]
+    codes = np.repeat(np.arange(regions, dtype=np.int16), len(YEARS) * per_cell)[:rows]
+    df = pd.DataFrame({
+        "Region": pd.Categorical.from_codes(codes, categories=names),
+        "Year": np.tile(np.repeat(YEARS, per_cell), regions)[:rows],
+    })
+    for m in range(metrics):
+        df[f"Metric_{m}"] = rng.uniform(0, 100, rows).astype(np.float32)
+    return df
+
+
+def mask_filter(df, regions, year_range):
+    return df[(df["Region"].isin(regions)) & (df["Year"].between(year_range[0], year_range[1]))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000, 50_000_000])
+    parser.add_argument("--regions", type=int, default=100)
+    parser.add_argument("--metrics", type=int, default=4)
+    args = parser.parse_args()
+
+    for rows in args.rows:
+        df = sorted_dataset(rows, args.regions, args.metrics)
+        started = time.perf_counter()
+        index = FilterIndex(df)
+        build = time.perf_counter() - started
+        cases = {
+            "moitié des régions, 2035-2045": (index.regions[::2], (2035, 2045)),
+            "une région": (index.regions[:1], (2030, 2050)),
+            "tout": (index.regions, (2030, 2050)),
+        }
+        print(f"\n{rows} lignes, {args.regions} régions (index construit en {build * 1000:.1f} ms)")
+        print(f"  {'sélection':<30} {'masque':>12} {'index':>12}")
+        for label, (regions, year_range) in cases.items():
+            assert mask_filter(df, regions, year_range).equals(index.select(regions, year_range))
+            number = max(1, 10_000_000 // rows)
+            timings = [
+                min(timeit.repeat(lambda: run(regions, year_range), number=number, repeat=3)) / number
+                for run in (lambda r, y: mask_filter(df, r, y), index.select)
+            ]
+            print(f"  {label:<30} {timings[0] * 1000:9.2f} ms {timings[1] * 1000:9.2f} ms   (x{timings[0] / timings[1]:.0f})")
+        df = index = None  # libère la mémoire avant la taille suivante
+
+
+if __name__ == "__main__":
+    main()
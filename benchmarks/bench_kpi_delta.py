@@ -0,0 +1,62 @@
+"""Benchmark : cartes KPI pendant un glissement du curseur « Période ».
+
+Grilles synthétiques de 100 années et d'un nombre croissant de régions.
+La moitié des régions est sélectionnée et la fenêtre glisse d'une année à
+la fois, comme un curseur qu'on fait glisser. Compare, par déplacement,
+le recalcul sur les lignes filtrées (``.mean()`` pandas) et la lecture
+des cumuls de la sélection (``KpiWindow.kpis``). La construction d'un
+``KpiWindow``, payée quand les régions changent, est mesurée à part.
+
+    python benchmarks/bench_kpi_delta.py [--regions 100 1000 10000] [--years 100] [--per-cell 3]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_kpi_window import grid_dataset  # noqa: E402
+from gaia_core.cube import MetricCube  # noqa: E402
+from gaia_core.filters import FilterIndex  # noqa: E402
+from gaia_core.kpi import KpiWindow  # noqa: E402
+
+KPI_METRICS = ("CO2_ppm", "Temp_anomaly_C", "Deforestation_pct", "Vulnerability_index")
+
+
+def timed(run, steps):
+    return min(timeit.repeat(run, number=1, repeat=3)) / steps * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--regions", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--years", type=int, default=100)
+    parser.add_argument("--per-cell", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'régions':>8} {'lignes':>10}  {'lignes filtrées':>16} {'cumuls':>10} {'KpiWindow()':>12}")
+    for regions in args.regions:
+        df = grid_dataset(regions, args.years, args.per_cell)
+        index = FilterIndex(df)
+        cube = MetricCube.from_frame(df)
+        selected = index.regions[::2]
+        first, width = index.year_min, args.years // 2
+        windows = [(first + shift, first + shift + width) for shift in range(args.years - width)]
+
+        window = KpiWindow(cube, selected, KPI_METRICS)
+        for year_range in windows[::10]:
+            expected = index.select(selected, year_range)[list(KPI_METRICS)].mean().to_numpy()
+            assert np.allclose(window.kpis(year_range).mean, expected, rtol=1e-6)
+
+        rows = timed(lambda: [index.select(selected, w)[list(KPI_METRICS)].mean() for w in windows], len(windows))
+        cumulative = timed(lambda: [window.kpis(w) for w in windows], len(windows))
+        build = timed(lambda: KpiWindow(cube, selected, KPI_METRICS), 1)
+        print(f"{regions:>8} {len(df):>10}  {rows:>13.3f} ms {cumulative:>7.3f} ms {build:>9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark : statistiques des cartes d'indicateurs.
+
+Grille synthétique de 1 000 régions × 100 années (plusieurs lignes par
+cellule). Sur la moitié des régions et la moitié des années, compare les
+appels pandas colonne par colonne (les quatre ``.mean()`` d'origine, puis
+effectif et moyenne pour chaque carte) au ``KpiSet`` tiré des sommes
+cumulées du cube (``KpiWindow``), cumuls de la sélection compris.
+
+    python benchmarks/bench_kpi_engine.py [--regions 1000] [--years 100] [--per-cell 10]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_kpi_window import grid_dataset  # noqa: E402
+from gaia_core.cube import MetricCube  # noqa: E402
+from gaia_core.filters import FilterIndex  # noqa: E402
+from gaia_core.kpi import KpiWindow  # noqa: E402
+
+KPI_METRICS = ("CO2_ppm", "Temp_anomaly_C", "Deforestation_pct", "Vulnerability_index")
+
+
+def pandas_means(frame):
+    return {metric: frame[metric].mean() for metric in KPI_METRICS}
+
+
+def pandas_stats(frame):
+    return {
+        metric: (frame[metric].count(), frame[metric].mean())
+        for metric in KPI_METRICS
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--regions", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=100)
+    parser.add_argument("--per-cell", type=int, default=10)
+    args = parser.parse_args()
+
+    df = grid_dataset(args.regions, args.years, args.per_cell)
+    index = FilterIndex(df)
+    cube = MetricCube.from_frame(df)
+    regions, year_range = index.regions[::2], (index.year_min, index.year_min + args.years // 2)
+    frame = index.select(regions, year_range)
+
+    expected = pandas_stats(frame)
+    kpis = KpiWindow(cube, regions, KPI_METRICS).kpis(year_range)
+    for metric, (count, mean) in expected.items():
+        assert kpis[metric].count == count and np.isclose(kpis[metric].mean, mean, rtol=1e-6)
+
+    print(f"{len(frame)} lignes sélectionnées sur {len(df)}, {len(KPI_METRICS)} cartes")
+    runs = {
+        "pandas, 4 × mean()": lambda: pandas_means(frame),
+        "pandas, 8 appels": lambda: pandas_stats(frame),
+        "KpiSet, cube": lambda: KpiWindow(cube, regions, KPI_METRICS).kpis(year_range),
+    }
+    for label, run in runs.items():
+        seconds = min(timeit.repeat(run, number=10, repeat=3)) / 10
+        print(f"  {label:<20} {seconds * 1000:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
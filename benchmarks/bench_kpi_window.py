@@ -0,0 +1,88 @@
+"""Benchmark : moyennes des cartes KPI sur une fenêtre d'années.
+
+Grille synthétique de 1 000 régions × 100 années (plusieurs lignes par
+cellule). Compare, pour une sélection de la moitié des régions et des
+fenêtres de largeurs variées, trois façons de calculer les moyennes :
+filtre brut du DataFrame, somme des cellules du cube, et sommes cumulées
+de la sélection (deux lectures par indicateur, ``KpiWindow.kpis``). Les
+cumuls de la sélection, additionnés quand les régions changent, sont
+mesurés à part.
+
+    python benchmarks/bench_kpi_window.py [--regions 1000] [--years 100] [--per-cell 3]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gaia_core.cube import MetricCube  # noqa: E402
+from gaia_core.kpi import KpiWindow  # noqa: E402
+
+METRICS = ["CO2_ppm", "Deforestation_pct", "SeaLevel_cm", "Temp_anomaly_C", "Vulnerability_index"]
+
+
+def grid_dataset(regions, years, per_cell, seed=0):
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Region_{i:05d}" for i in range(regions)])
+    rows = regions * years * per_cell
+    df = pd.DataFrame({
+        "Region": pd.Categorical(np.repeat(names, years * per_cell)),
+        "Year": np.tile(np.repeat(np.arange(2000, 2000 + years, dtype=np.int16), per_cell), regions),
+    })
+    for metric in METRICS:
+        df[metric] = rng.uniform(0, 100, rows).astype(np.float32)
+    return df
+
+
+def raw_means(df, regions, year_range):
+    filtered = df[df["Region"].isin(regions) & df["Year"].between(*year_range)]
+    return filtered[METRICS].mean()
+
+
+def cell_means(cube, regions, year_range):
+    cells = (cube._region_positions(regions), cube._year_slice(year_range))
+    return cube.sums[cells].sum(axis=(0, 1)) / cube.counts[cells].sum(axis=(0, 1))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--regions", type=int, default=1000)
+    parser.add_argument("--years", type=int, default=100)
+    parser.add_argument("--per-cell", type=int, default=3)
+    args = parser.parse_args()
+
+    df = grid_dataset(args.regions, args.years, args.per_cell)
+    cube = MetricCube.from_frame(df)
+    selected = cube.regions[::2]
+    first = int(cube.years[0])
+    window = KpiWindow(cube, selected, METRICS)
+    windows = [(first + 10, first + 20), (first, first + args.years // 2), (first, first + args.years - 1)]
+
+    for year_range in windows:
+        expected = raw_means(df, selected, year_range).to_numpy()
+        assert np.allclose(window.kpis(year_range).mean, expected, rtol=1e-6)
+
+    build = min(timeit.repeat(lambda: KpiWindow(cube, selected, METRICS), number=20, repeat=3)) / 20
+    print(f"{len(df)} lignes, {args.regions} régions × {args.years} années, {len(selected)} régions sélectionnées")
+    print(f"  cumuls de la sélection : {build * 1000:.3f} ms (quand les régions changent)")
+    print(f"  {'fenêtre':<12} {'DataFrame':>12} {'cellules':>12} {'cumuls':>12}")
+    for year_range in windows:
+        timings = []
+        for run in (
+            lambda: raw_means(df, selected, year_range),
+            lambda: cell_means(cube, selected, year_range),
+            lambda: window.kpis(year_range).mean,
+        ):
+            timings.append(min(timeit.repeat(run, number=20, repeat=3)) / 20)
+        label = f"{year_range[0]}-{year_range[1]}"
+        print(f"  {label:<12} " + " ".join(f"{t * 1000:9.3f} ms" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
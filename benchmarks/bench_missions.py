@@ -0,0 +1,90 @@
+"""Micro-benchmark : moteur de missions déclaré en JSON.
+
+Génère une partie de ``--steps`` missions (mots-clés exacts, mots-clés
+contenus, expression régulière, égalité, longueur), mesure la lecture et
+la compilation du fichier, faite une fois par processus, puis le coût
+d'une validation compilée, comparé à l'ancien test écrit en ligne
+(``answer.lower().strip() in [...]``, ``"..." in answer.lower()``), et
+la lecture du corrigé calculé sur le jeu de données (``answer_key``) :
+première évaluation des requêtes, puis lecture mémorisée.
+
+    python benchmarks/bench_missions.py [--steps 60]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gaia_core import answers  # noqa: E402
+from gaia_core.missions import MISSIONS, load_missions  # noqa: E402
+
+VALIDATORS = (
+    {"type": "keywords", "match": "exact", "words": ["archipel", "sud", "île", "atoll"]},
+    {"type": "keywords", "match": "contains", "words": ["inverse", "baisse", "diminue", "recule"]},
+    {"type": "regex", "pattern": r"\b20[34]\d\b"},
+    {"type": "equals", "value": 2045},
+    {"type": "longer_than", "value": 30},
+)
+
+
+def game_spec(steps):
+    missions = []
+    for number in range(1, steps + 1):
+        missions.append({
+            "number": number,
+            "objective": f"Objectif {number}",
+            "hint": f"Indice {number}",
+            "widget": "number_input" if number % 5 == 4 else "text_input",
+            "label": "Votre réponse :",
+            "button": f"Valider la mission {number}",
+            "points": 10,
+            "validator": VALIDATORS[(number - 1) % len(VALIDATORS)],
+            "success": "✅",
+            "failure": "❌",
+            **({"next": number + 1} if number < steps else {}),
+        })
+    return {"final_hint": "🏆", "low_score_hint": "…", "default_hint": "…", "missions": missions}
+
+
+def per_call_us(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=60)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "missions.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(game_spec(args.steps), f, ensure_ascii=False)
+        _, missions, _ = load_missions(path)
+        compile_ms = min(timeit.repeat(lambda: load_missions(path), number=10, repeat=3)) / 10 * 1000
+    print(f"{len(missions)} missions : lecture + compilation {compile_ms:.3f} ms (une fois par processus)")
+
+    cold = timeit.timeit(lambda: (answers._answer_keys.clear(), MISSIONS[1].validate("Archipel"), MISSIONS[3].validate(2045)), number=10) / 10
+    print(f"corrigé des missions 1 et 3 : {cold * 1000:.3f} ms au premier appel (jeu de données déjà chargé)")
+
+    answer = "La relation est plutôt inverse : le CO₂ baisse"
+    inline_exact = lambda: answer.lower().strip() in ["archipel", "sud"]  # noqa: E731
+    inline_contains = lambda: "inverse" in answer.lower() or "baisse" in answer.lower()  # noqa: E731
+    runs = {
+        "en ligne, exact": inline_exact,
+        "compilé, exact": lambda: missions[1].validate(answer),
+        "corrigé mémorisé": lambda: MISSIONS[1].validate(answer),
+        "en ligne, contient": inline_contains,
+        "compilé, contient": lambda: MISSIONS[2].validate(answer),
+        "compilé, regex": lambda: missions[3].validate(answer),
+    }
+    for label, run in runs.items():
+        print(f"  {label:<20} {per_call_us(run, 100_000):8.3f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Micro-benchmark : recherche d'une équipe, balayage DataFrame vs index.
+
+Compare l'ancien motif (``team in df["Team"].values`` puis
+``df.loc[df["Team"] == team, ...]``) à ``get()`` sur l'index en mémoire du
+stockage, ainsi que le coût d'un upsert, pour 10 000 équipes.
+
+    python benchmarks/bench_team_lookup.py [--teams 10000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# On mesure l'upsert dans l'index, pas la mise en file de l'écriture différée.
+os.environ.setdefault("GAIA_WRITE_BEHIND_MS", "0")
+
+from gaia_core.progress import SQLiteProgressStore  # noqa: E402
+
+
+def per_call_us(fn, number):
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SQLiteProgressStore(os.path.join(tmp, "progress.db"))
+        names = [f"Equipe {i:05d}" for i in range(args.teams)]
+        with store._transaction() as conn:
+            conn.executemany(
+                "INSERT INTO progress (game_id, team, mission, score, hint, last_update) VALUES (?, ?, 1, 0, '', '')",
+                [(store.game, name) for name in names],
+            )
+        df = store.load()
+        rng = random.Random(0)
+
+        def scan():
+            team = rng.choice(names)
+            if team in df["Team"].values:
+                int(df.loc[df["Team"] == team, "Mission"].values[0])
+                int(df.loc[df["Team"] == team, "Score"].values[0])
+
+        def indexed():
+            record = store.get(rng.choice(names))
+            int(record["Mission"])
+            int(record["Score"])
+
+        def upsert():
+            store.update_progress(rng.choice(names), 2, 30, "indice")
+
+        results = {
+            "balayage DataFrame": per_call_us(scan, 200),
+            "index get()": per_call_us(indexed, 2000),
+            "upsert + get()": per_call_us(lambda: (upsert(), indexed()), 200),
+        }
+        print(f"{args.teams} équipes")
+        for label, us in results.items():
+            print(f"  {label:<20} {us:10.1f} µs/appel")
+        print(f"  gain lecture : x{results['balayage DataFrame'] / results['index get()']:.0f}")
+
+
+if __name__ == "__main__":
+    main()
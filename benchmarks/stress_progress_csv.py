@@ -0,0 +1,68 @@
+"""Test de charge multi-processus du stockage CSV de la progression.
+
+50 processus appellent ``update_progress`` en même temps (chacun pour sa
+propre équipe, plusieurs tours d'affilée). Sans verrou ni remplacement
+atomique, des équipes disparaissent ; ici aucune mise à jour ne doit être
+perdue.
+
+    python benchmarks/stress_progress_csv.py [--processes 50] [--rounds 5]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Un cycle lecture-modification-écriture verrouillé par appel : la file
+# d'écriture différée fusionnerait les tours d'un processus en une écriture.
+os.environ.setdefault("GAIA_WRITE_BEHIND_MS", "0")
+
+from gaia_core.progress import CSVProgressStore  # noqa: E402
+
+
+def worker(path, team, rounds, barrier):
+    store = CSVProgressStore(path)
+    barrier.wait()
+    for mission in range(1, rounds + 1):
+        store.update_progress(team, mission, mission * 10, f"tour {mission}")
+    # Si GAIA_WRITE_BEHIND_MS est imposé : les processus fils ne passent pas
+    # par atexit, on vide la file à la main.
+    store.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processes", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "progress.csv")
+        CSVProgressStore(path)
+        barrier = multiprocessing.Barrier(args.processes)
+        procs = [
+            multiprocessing.Process(target=worker, args=(path, f"Equipe {i:02d}", args.rounds, barrier))
+            for i in range(args.processes)
+        ]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+        if any(proc.exitcode for proc in procs):
+            sys.exit("Un processus a échoué.")
+
+        df = CSVProgressStore(path).load()
+        expected = {f"Equipe {i:02d}" for i in range(args.processes)}
+        missing = expected - set(df["Team"])
+        stale = df[df["Mission"].astype(int) != args.rounds]
+        duplicated = df["Team"].duplicated().sum()
+        print(f"{len(df)} équipes, {len(missing)} manquantes, {len(stale)} en retard, {duplicated} doublons")
+        if missing or len(stale) or duplicated:
+            sys.exit("ÉCHEC : des mises à jour ont été perdues.")
+        print("OK : aucune mise à jour perdue.")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,11 @@
 # Fichier : gaia_admin_dashboard.py
 
 import streamlit as st
-import pandas as pd
-import datetime
-import os
+
+from gaia_core import adjust_team, load_progress, reset_progress, send_hint
+from gaia_core.missions import FIRST_MISSION, LAST_MISSION
+from gaia_core.progress import GAME_ID_PATTERN
+from gaia_core.team import current_game
 
 # -------------------------------
 # CONFIGURATION DE LA PAGE
@@ -17,21 +19,6 @@ st.set_page_config(
     layout="wide"
 )
 
-# -------------------------------
-# FICHIER DE PROGRESSION
-# -------------------------------
-progress_file = os.getenv("GAIA_PROGRESS_PATH", "progress.csv")
-
-if not os.path.exists(progress_file):
-    df_init = pd.DataFrame(columns=["Team", "Mission", "Score", "Hint", "Last_Update"])
-    df_init.to_csv(progress_file, index=False)
-
-def load_progress():
-    return pd.read_csv(progress_file)
-
-def save_progress(df):
-    df.to_csv(progress_file, index=False)
-
 # -------------------------------
 # STYLE
 # -------------------------------
@@ -65,11 +52,25 @@ st.markdown("""
 st.markdown('<div class="title">🛰️ Tableau de bord – Opération Sauver Gaïa</div>', unsafe_allow_html=True)
 st.markdown('<div class="subtitle">Suivi en temps réel des équipes</div>', unsafe_allow_html=True)
 
+# -------------------------------
+# PARTIE SUIVIE
+# -------------------------------
+game_id = current_game()
+requested_game = st.sidebar.text_input("🎲 Partie suivie :", value=game_id).strip() or game_id
+if not GAME_ID_PATTERN.fullmatch(requested_game):
+    # L'URL n'est changée que pour un identifiant valide : sinon
+    # ``current_game()`` arrêterait la page avant ce champ, impossible à corriger.
+    st.sidebar.error("Identifiant de partie invalide (lettres, chiffres, _ et - uniquement).")
+elif requested_game != game_id:
+    st.query_params["game"] = requested_game
+    st.rerun()
+st.sidebar.caption(f"Lien des équipes : `?game={game_id}`")
+
 # -------------------------------
 # AFFICHAGE DES DONNÉES
 # -------------------------------
-st.header("📋 Progression des équipes")
-progress = load_progress()
+st.header(f"📋 Progression des équipes – partie « {game_id} »")
+progress = load_progress(game=game_id)
 
 if progress.empty:
     st.info("Aucune équipe enregistrée pour l'instant.")
@@ -86,10 +87,7 @@ if not progress.empty:
     custom_hint = st.text_area("Écris l'indice ou message à envoyer :")
 
     if st.button("📨 Envoyer l'indice"):
-        progress.loc[progress["Team"] == team_selected, ["Hint", "Last_Update"]] = [
-            custom_hint, datetime.datetime.now().strftime("%H:%M:%S")
-        ]
-        save_progress(progress)
+        send_hint(team_selected, custom_hint, game=game_id)
         st.success(f"Indice envoyé à **{team_selected}** ✅")
 
 # -------------------------------
@@ -103,24 +101,20 @@ if not progress.empty:
     with col1:
         new_score = st.number_input("Nouveau score :", min_value=0, step=5)
     with col2:
-        new_mission = st.number_input("Mission actuelle :", min_value=1, max_value=4, step=1)
+        new_mission = st.number_input("Mission actuelle :", min_value=FIRST_MISSION, max_value=LAST_MISSION, step=1)
 
     if st.button("🔁 Mettre à jour les informations"):
-        progress.loc[progress["Team"] == team_selected2, ["Score", "Mission", "Last_Update"]] = [
-            new_score, new_mission, datetime.datetime.now().strftime("%H:%M:%S")
-        ]
-        save_progress(progress)
+        adjust_team(team_selected2, new_score, new_mission, game=game_id)
         st.success(f"✅ Données mises à jour pour {team_selected2}")
 
 # -------------------------------
 # RÉINITIALISER LE JEU
 # -------------------------------
-st.header("🧹 Réinitialiser toutes les données")
+st.header("🧹 Réinitialiser la partie")
 
-if st.button("⚠️ Réinitialiser le fichier de progression"):
-    df_init = pd.DataFrame(columns=["Team", "Mission", "Score", "Hint", "Last_Update"])
-    save_progress(df_init)
-    st.warning("Toutes les données ont été réinitialisées. Le jeu recommence à zéro.")
+if st.button("⚠️ Réinitialiser la progression de cette partie"):
+    reset_progress(game=game_id)
+    st.warning(f"La partie « {game_id} » a été réinitialisée. Le jeu recommence à zéro ; les autres parties ne sont pas touchées.")
 
 # -------------------------------
 # NOTES FINALES
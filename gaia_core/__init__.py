@@ -0,0 +1,35 @@
+"""Cœur partagé de l'Opération Sauver Gaïa : progression, données et missions.
+
+Toutes les pages Streamlit passent par ce paquet : un seul cache de données
+et un seul stockage de progression par processus.
+"""
+
+from gaia_core.dataset import load_cube, load_data, load_index
+from gaia_core.missions import MISSIONS, get_hint, submit_answer
+from gaia_core.progress import (
+    adjust_team,
+    flush_progress,
+    get_store,
+    get_team,
+    load_progress,
+    reset_progress,
+    send_hint,
+    update_progress,
+)
+
+__all__ = [
+    "MISSIONS",
+    "adjust_team",
+    "flush_progress",
+    "get_hint",
+    "get_store",
+    "get_team",
+    "load_cube",
+    "load_data",
+    "load_index",
+    "load_progress",
+    "reset_progress",
+    "send_hint",
+    "submit_answer",
+    "update_progress",
+]
@@ -0,0 +1,22 @@
+"""Commandes d'administration : ``python -m gaia_core import <progress.csv> [partie] | compact [partie]``."""
+
+import sys
+
+from gaia_core.progress import get_store
+
+
+def main(argv):
+    if len(argv) in (2, 3) and argv[0] == "import":
+        store = get_store(backend="sqlite", game=argv[2] if len(argv) == 3 else None)
+        count = store.import_csv(argv[1])
+        print(f"{count} équipe(s) importée(s) dans {store.path} (partie « {store.game} »)")
+    elif len(argv) in (1, 2) and argv[0] == "compact":
+        store = get_store(backend="journal", game=argv[1] if len(argv) == 2 else None)
+        store.compact()
+        print(f"Journal compacté : {store.snapshot_path}")
+    else:
+        sys.exit("Usage : python -m gaia_core import <progress.csv> [partie] | compact [partie]")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,48 @@
+"""Petits utilitaires fichiers partagés par les modules de ``gaia_core``."""
+
+import contextlib
+import os
+import tempfile
+
+try:
+    import fcntl
+except ImportError:  # Windows : pas de verrou consultatif
+    fcntl = None
+
+
+def file_token(path):
+    """Jeton ``(inode, mtime_ns, taille)`` d'un fichier, ou ``None`` s'il n'existe pas."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+def atomic_write(path, write, binary=False):
+    """Écrit ``path`` via un fichier temporaire voisin puis ``os.replace``."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".gaia-", suffix=".tmp")
+    try:
+        with (os.fdopen(fd, "wb") if binary else os.fdopen(fd, "w", newline="", encoding="utf-8")) as tmp:
+            write(tmp)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+@contextlib.contextmanager
+def flock(lock_path, exclusive=True):
+    """Verrou consultatif ``fcntl`` (exclusif ou partagé) sur ``lock_path``."""
+    with open(lock_path, "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
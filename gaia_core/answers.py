@@ -0,0 +1,112 @@
+# ===============================
+# 🗝️ Opération Sauver Gaïa - Corrigé des missions
+# ===============================
+# Fichier : gaia_core/answers.py
+"""Réponses attendues des missions, calculées sur le jeu de données chargé.
+
+Une mission dont le validateur est de type ``answer_key`` ne contient pas
+sa réponse : elle nomme une requête de ``QUERIES`` et ses paramètres
+(``register``). Les requêtes sont évaluées ensemble sur le cube Région ×
+Année (moyennes de cellules, vectorisées sur toutes les régions et
+années), une fois par version du jeu de données : le corrigé est mémorisé
+avec l'empreinte du fichier (``file_token``), et valider une réponse
+revient à lire un dictionnaire. Avec ``GAIA_DATASET_PATH``, le corrigé
+suit donc le jeu de données ; une requête sans réponse sur ce fichier
+lève ``AnswerKeyError`` au lieu de rendre sa mission impossible.
+"""
+
+import threading
+
+import numpy as np
+
+from gaia_core.dataset import _load_entry, dataset_path
+
+
+def cell_means(cube, metric):
+    """Moyenne de ``metric`` par (région, année) : tableau (régions, années), NaN si vide."""
+    m = cube.metrics.index(metric)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return cube.sums[:, :, m] / cube.counts[:, :, m]
+
+
+def most_vulnerable_region(cube, year, metric="Vulnerability_index_0_100"):
+    """Région de plus forte moyenne de ``metric`` en ``year``, ou ``None``."""
+    means = cell_means(cube, metric)
+    # Argmax de chaque année d'un coup ; les cellules vides ne gagnent jamais.
+    leaders = np.where(np.isnan(means), -np.inf, means).argmax(axis=0)
+    known = ~np.isnan(means).all(axis=0)
+    column = np.searchsorted(cube.years, year)
+    if column == len(cube.years) or cube.years[column] != year or not known[column]:
+        return None
+    return cube.regions[leaders[column]]
+
+
+def first_year_above(cube, threshold, metric="Temp_anomaly_C"):
+    """Première année où la moyenne de ``metric`` sur toutes les régions dépasse ``threshold``, ou ``None``."""
+    m = cube.metrics.index(metric)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        yearly = cube.sums[:, :, m].sum(axis=0) / cube.counts[:, :, m].sum(axis=0)
+    above = np.flatnonzero(yearly > threshold)
+    return int(cube.years[above[0]]) if len(above) else None
+
+
+QUERIES = {
+    "most_vulnerable_region": most_vulnerable_region,
+    "first_year_above": first_year_above,
+}
+
+# Requêtes déclarées par les missions : {clé: (requête, paramètres)}.
+_registered = {}
+_answer_keys = {}  # chemin -> (empreinte, {clé: réponse})
+_answer_keys_lock = threading.Lock()
+
+
+class AnswerKeyError(ValueError):
+    """Une requête du corrigé n'a pas de réponse sur le jeu de données chargé."""
+
+
+def register(query, args):
+    """Déclare une requête du corrigé ; retourne sa clé pour ``expected_answer``."""
+    key = (query, tuple(sorted(args.items())))
+    _registered[key] = (query, args)
+    return key
+
+
+def answer_key(path=None):
+    """Corrigé complet ``{clé: réponse}`` du jeu de données de ``path``.
+
+    Toutes les requêtes déclarées sont évaluées ensemble, une fois par
+    version du fichier. Une requête sans réponse (seuil jamais franchi,
+    année absente) vaut ``None``.
+    """
+    path = path or dataset_path()
+    token, _, cube, _ = _load_entry(path)
+    cached = _answer_keys.get(path)
+    if cached is None or cached[0] != token or len(cached[1]) != len(_registered):
+        with _answer_keys_lock:
+            cached = _answer_keys.get(path)
+            if cached is None or cached[0] != token or len(cached[1]) != len(_registered):
+                key = {k: QUERIES[query](cube, **args) for k, (query, args) in _registered.items()}
+                cached = _answer_keys[path] = (token, key)
+    return cached[1]
+
+
+def expected_answer(key, path=None):
+    """Réponse attendue pour la clé ``key`` de ``register``.
+
+    Sans réponse sur ce jeu de données, la mission ne pourrait jamais être
+    validée : ``AnswerKeyError`` est levée, tant que le fichier ne change
+    pas. Les autres missions n'en sont pas affectées.
+    """
+    answer = answer_key(path)[key]
+    if answer is None:
+        query, args = key
+        described = f"{query}({', '.join(f'{n}={v}' for n, v in args)})"
+        raise AnswerKeyError(f"{path or dataset_path()} : aucune réponse pour {described}")
+    return answer
+
+
+def dataset_years(path=None):
+    """Première et dernière années du jeu de données, pour borner les saisies d'année."""
+    years = _load_entry(path or dataset_path())[2].years
+    return int(years[0]), int(years[-1])
@@ -0,0 +1,198 @@
+# ===============================
+# 📉 Opération Sauver Gaïa - Graphiques du tableau de bord
+# ===============================
+# Fichier : gaia_core/charts.py
+"""Specs Vega-Lite des graphiques du tableau de bord.
+
+Chaque graphique Altair est converti une fois en spec, réutilisable par
+``st.vega_lite_chart``. Ses données sont réduites aux colonnes qu'il encode
+(2 à 4 sur 12) avant d'être envoyées : Streamlit les transmet en Arrow sous
+``datasets``, comme pour ``st.altair_chart``.
+
+Le tableau de bord empile les graphiques d'un même onglet dans une seule
+spec (``build_tab_spec``) : ils lisent le même jeu de données nommé, que
+Streamlit n'envoie qu'une fois. Sur de gros volumes, les courbes lisent
+un second jeu sous-échantillonné (``gaia_core.downsample``) et le nuage
+de points un histogramme 2D (``gaia_core.density``).
+"""
+
+import contextlib
+import functools
+import json
+
+import altair as alt
+import pyarrow as pa
+
+from gaia_core.dataset import for_display
+from gaia_core.density import binned_density, max_scatter_points, worth_binning
+from gaia_core.downsample import minmax_downsample
+
+DATASET_NAME = "filtered"
+
+# Les données ne passent pas par le JSON de la spec : elles sont remises
+# sous ``datasets`` par ``chart_spec``.
+alt.data_transformers.register("gaia_named", lambda data: {"name": DATASET_NAME})
+
+
+def encoded_fields(spec):
+    """Colonnes encodées par jeu de données nommé : ``{nom: [colonnes]}``.
+
+    Parcourt les sous-graphiques ; chacun lit le jeu de données de son
+    ``data`` ou, à défaut, celui de son parent. ``None`` si la spec a des
+    transformations : elles peuvent lire d'autres colonnes, qu'on ne sait
+    pas deviner.
+    """
+    fields = {}
+
+    def walk(node, name, in_encoding):
+        if isinstance(node, dict):
+            if "transform" in node:
+                return False
+            if not in_encoding and isinstance(node.get("data"), dict):
+                name = node["data"].get("name", name)
+            field = node.get("field")
+            if in_encoding and isinstance(field, str) and field not in fields.setdefault(name, []):
+                fields[name].append(field)
+            return all(walk(value, name, in_encoding or key == "encoding") for key, value in node.items())
+        if isinstance(node, list):
+            return all(walk(value, name, in_encoding) for value in node)
+        return True
+
+    return fields if walk(spec, None, False) else None
+
+
+def chart_spec(chart, datasets=None):
+    """Spec Vega-Lite de ``chart``, ses données réduites aux colonnes encodées.
+
+    ``datasets`` associe un nom aux DataFrames des ``alt.NamedData`` du
+    graphique ; par défaut, le DataFrame de ``chart`` sous ``DATASET_NAME``.
+    ``st.altair_chart`` refait cette conversion (validation du schéma
+    comprise) à chaque rendu ; ici elle est faite une fois par sélection et
+    mémorisée avec le résultat du filtre.
+    """
+    # Comme Streamlit : le thème Altair par défaut impose des dimensions.
+    theme = alt.themes.enable("none") if alt.themes.active == "default" else contextlib.nullcontext()
+    with theme, alt.data_transformers.enable("gaia_named"):
+        spec = chart.to_dict()
+    datasets = datasets or {DATASET_NAME: chart.data}
+    fields = encoded_fields(spec)
+    # Index remis à zéro : sinon Streamlit l'envoie comme une colonne de plus.
+    spec["datasets"] = {
+        name: for_display(frame if fields is None else frame[fields[name]]).reset_index(drop=True)
+        for name, frame in datasets.items()
+        if fields is None or name in fields
+    }
+    return spec
+
+
+def payload_bytes(spec):
+    """Octets envoyés au navigateur pour ``spec`` : ``(spec JSON, données Arrow)``."""
+    body = {key: value for key, value in spec.items() if key != "datasets"}
+    data = 0
+    for frame in spec.get("datasets", {}).values():
+        sink = pa.BufferOutputStream()
+        table = pa.Table.from_pandas(frame)
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        data += sink.getvalue().size
+    return len(json.dumps(body).encode("utf-8")), data
+
+
+# Graphiques de chaque onglet du tableau de bord, dans l'ordre d'affichage.
+TAB_CHARTS = {
+    "climate": ("co2", "temp"),
+    "ecology": ("deforestation", "sea"),
+    "energy": ("renewables", "scatter"),
+}
+
+# Courbes et aires : indicateur tracé, sous-échantillonné au-delà de
+# ``GAIA_CHART_MAX_POINTS`` points par région.
+SERIES_METRICS = {
+    "co2": "CO2_ppm",
+    "temp": "Temp_anomaly_C",
+    "sea": "SeaLevel_cm",
+    "renewables": "Renewable_share_pct",
+}
+
+CHARTS = {
+    "co2": lambda data: alt.Chart(data, title="Évolution du CO₂ (ppm)").mark_line(point=True).encode(
+        x="Year:O", y="CO2_ppm:Q", color="Region:N",
+        tooltip=["Region:N", "Year:Q", "CO2_ppm:Q"]
+    ).properties(width="container", height=400),
+    "temp": lambda data: alt.Chart(data, title="Anomalie de température (°C)").mark_area(opacity=0.5).encode(
+        x="Year:O", y="Temp_anomaly_C:Q", color="Region:N"
+    ).properties(width="container", height=350),
+    "deforestation": lambda data: alt.Chart(data, title="Déforestation (%)").mark_bar().encode(
+        x="Year:O", y="Deforestation_pct:Q", color="Region:N",
+        tooltip=["Region:N", "Year:Q", "Deforestation_pct:Q"]
+    ).properties(width="container", height=400),
+    "sea": lambda data: alt.Chart(data, title="Niveau moyen de la mer (cm)").mark_line().encode(
+        x="Year:O", y="SeaLevel_cm:Q", color="Region:N"
+    ).properties(width="container", height=350),
+    "renewables": lambda data: alt.Chart(data, title="Part des énergies renouvelables (%)").mark_area(opacity=0.6).encode(
+        x="Year:O", y="Renewable_share_pct:Q", color="Region:N"
+    ).properties(width="container", height=350),
+    "scatter": lambda data: alt.Chart(data, title="Corrélation : Énergies renouvelables vs Vulnérabilité").mark_circle(size=90, opacity=0.7).encode(
+        x="Renewable_share_pct:Q",
+        y="Vulnerability_index_0_100:Q",
+        color="Region:N",
+        tooltip=["Region:N", "Year:Q", "Renewable_share_pct:Q", "Vulnerability_index_0_100:Q"]
+    ).properties(width="container", height=400),
+    # Même nuage en densité : une case par (région, case de la grille) ;
+    # Vega-Lite déduit la fin de chaque case de son début et du pas.
+    "scatter_density": lambda data, x_step, y_step: alt.Chart(data, title="Corrélation : Énergies renouvelables vs Vulnérabilité").mark_rect().encode(
+        x=alt.X("x_start:Q", bin=alt.Bin(binned=True, step=x_step), title="Renewable_share_pct"),
+        y=alt.Y("y_start:Q", bin=alt.Bin(binned=True, step=y_step), title="Vulnerability_index_0_100"),
+        color="Region:N",
+        opacity=alt.Opacity("count:Q", title="Lignes", scale=alt.Scale(range=[0.25, 0.9])),
+        tooltip=[
+            alt.Tooltip("Region:N"),
+            alt.Tooltip("count:Q", title="Lignes"),
+            alt.Tooltip("x_mean:Q", title="Renouvelables moy. (%)"),
+            alt.Tooltip("y_mean:Q", title="Vulnérabilité moy."),
+            alt.Tooltip("x_start:Q", title="Renouvelables dès"),
+            alt.Tooltip("y_start:Q", title="Vulnérabilité dès"),
+        ],
+    ).properties(width="container", height=400),
+}
+
+
+def build_chart_specs(frame):
+    """Une spec par graphique, chacune avec sa propre copie des lignes."""
+    return {name: chart_spec(CHARTS[name](frame)) for names in TAB_CHARTS.values() for name in names}
+
+
+def build_tab_spec(frame, tab, max_points=None):
+    """Spec d'un onglet : ses graphiques empilés, sur des jeux de données nommés.
+
+    Les courbes lisent les lignes sous-échantillonnées (``minmax_downsample``),
+    le nuage de points devient un histogramme 2D par région au-delà de
+    ``GAIA_SCATTER_MAX_POINTS`` lignes (``binned_density``) si la grille
+    réduit vraiment le nombre de marques (``worth_binning``), les autres
+    graphiques lisent toutes les lignes. Tant qu'il n'y a rien à réduire,
+    tout l'onglet partage un seul jeu de données, qui ne voyage qu'une
+    fois, réduit à l'union des colonnes encodées.
+    """
+    names = TAB_CHARTS[tab]
+    series = minmax_downsample(frame, [SERIES_METRICS[n] for n in names if n in SERIES_METRICS], max_points)
+    datasets = {DATASET_NAME: frame}
+    builds = {name: (CHARTS[name], DATASET_NAME) for name in names}
+    if series is not frame:
+        datasets["series"] = series
+        builds.update({name: (CHARTS[name], "series") for name in names if name in SERIES_METRICS})
+    if "scatter" in names and len(frame) > max_scatter_points():
+        density = binned_density(frame, "Renewable_share_pct", "Vulnerability_index_0_100")
+        if worth_binning(density, len(frame)):
+            datasets["density"] = density
+            builds["scatter"] = (functools.partial(CHARTS["scatter_density"], **density.attrs), "density")
+    charts = [build(alt.NamedData(source)) for build, source in builds.values()]
+    return chart_spec(
+        alt.vconcat(*charts, spacing=40)
+        # Titres à la taille des anciens sous-titres Streamlit.
+        .configure_title(fontSize=20, anchor="start", offset=12),
+        datasets,
+    )
+
+
+def build_tab_specs(frame):
+    return {tab: build_tab_spec(frame, tab) for tab in TAB_CHARTS}
@@ -0,0 +1,77 @@
+# ===============================
+# 🧊 Opération Sauver Gaïa - Cube Région × Année
+# ===============================
+# Fichier : gaia_core/cube.py
+"""Agrégats pré-calculés par (région, année) pour les indicateurs.
+
+Le cube garde, pour chaque indicateur, la somme et le nombre de valeurs
+de chaque cellule (région, année), ainsi que les sommes cumulées des
+sommes et effectifs le long des années. Le total d'une région sur une
+fenêtre [a, b] est alors une différence de deux cases du cumul. Les
+cumuls d'une sélection de régions s'additionnent une fois
+(``selection_cumsums``) ; chaque fenêtre coûte ensuite deux lectures par
+indicateur, quelle que soit la taille du jeu de données et la largeur de
+la fenêtre (``KpiWindow``).
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _prefix(cells):
+    cum = np.zeros((cells.shape[0], cells.shape[1] + 1, cells.shape[2]), dtype=cells.dtype)
+    np.cumsum(cells, axis=1, out=cum[:, 1:])
+    return cum
+
+
+class MetricCube:
+    def __init__(self, regions, years, metrics, sums, counts):
+        self.regions = regions
+        self.years = years
+        self.metrics = metrics
+        self.sums = sums  # (régions, années, indicateurs), float64
+        self.counts = counts  # idem, int64 (les NaN ne comptent pas)
+        # Cumuls le long des années, précédés d'une tranche de zéros :
+        # cum[:, k] = total des k premières années.
+        self.cum_sums = _prefix(sums)
+        self.cum_counts = _prefix(counts)
+        self._region_index = {region: i for i, region in enumerate(regions)}
+
+    @classmethod
+    def from_frame(cls, df, region="Region", year="Year"):
+        metrics = [c for c in df.columns if c not in (region, year) and pd.api.types.is_float_dtype(df[c])]
+        region_codes, regions = pd.factorize(df[region], sort=False)
+        years = np.unique(df[year].to_numpy())
+        year_codes = np.searchsorted(years, df[year].to_numpy())
+        cells = len(regions) * len(years)
+        flat = region_codes * len(years) + year_codes
+
+        sums = np.empty((cells, len(metrics)))
+        counts = np.empty((cells, len(metrics)), dtype=np.int64)
+        for m, metric in enumerate(metrics):
+            values = df[metric].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            sums[:, m] = np.bincount(flat[valid], weights=values[valid], minlength=cells)
+            counts[:, m] = np.bincount(flat[valid], minlength=cells)
+        shape = (len(regions), len(years), len(metrics))
+        return cls(list(regions), years, metrics, sums.reshape(shape), counts.reshape(shape))
+
+    def _region_positions(self, regions):
+        return np.array([self._region_index[r] for r in regions if r in self._region_index], dtype=np.intp)
+
+    def _year_slice(self, year_range):
+        start = np.searchsorted(self.years, year_range[0], side="left")
+        end = np.searchsorted(self.years, year_range[1], side="right")
+        # Fenêtre inversée (début > fin) : vide, comme ``FilterIndex.ranges``.
+        return slice(start, max(start, end))
+
+    def selection_cumsums(self, regions, metrics=None):
+        """Cumuls des effectifs et sommes d'une sélection de régions le long des années.
+
+        Deux tableaux (années + 1, indicateurs), précédés d'une ligne de
+        zéros comme ``cum_counts`` : les totaux de la fenêtre ``w`` de
+        ``_year_slice`` sont ``cum[w.stop] - cum[w.start]``.
+        """
+        columns = [self.metrics.index(metric) for metric in (metrics or self.metrics)]
+        positions = self._region_positions(regions)
+        return self.cum_counts[positions].sum(axis=0)[:, columns], self.cum_sums[positions].sum(axis=0)[:, columns]
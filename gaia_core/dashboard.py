@@ -0,0 +1,142 @@
+# ===============================
+# 🌍 Opération Sauver Gaïa - Tableau de bord
+# ===============================
+# Fichier : gaia_core/dashboard.py
+"""Tableau de bord environnemental, commun à ``app.py`` et ``gaia_streamlit_app.py``."""
+
+import os
+
+import streamlit as st
+
+from gaia_core.charts import build_tab_spec
+from gaia_core.export import EXPORT_FORMATS, export_bytes
+from gaia_core.kpi import KPI_METRICS, KpiWindow
+
+STYLES = """
+<style>
+    body {
+        background-color: #f7fcf9;
+    }
+    .main-header {
+        font-size: 2.8em;
+        color: #2E8B57;
+        text-align: center;
+        margin-bottom: 5px;
+    }
+    .subtitle {
+        text-align: center;
+        color: #555;
+        font-style: italic;
+        margin-bottom: 40px;
+    }
+    .metric-card {
+        background-color: #ecf9f1;
+        padding: 15px;
+        border-radius: 10px;
+        border-left: 5px solid #2E8B57;
+        margin: 10px 0;
+        text-align: center;
+    }
+    .sidebar-header {
+        font-size: 1.2em;
+        font-weight: bold;
+        color: #2E8B57;
+    }
+    .footer {
+        text-align: center;
+        font-style: italic;
+        color: #666;
+        margin-top: 60px;
+    }
+</style>
+"""
+
+# Cartes d'indicateurs : (indicateur, titre, format de la moyenne).
+CARDS = (
+    ("CO2_ppm", "CO₂ Moyen", "{:.1f} ppm"),
+    ("Temp_anomaly_C", "Température Moy.", "{:.2f} °C"),
+    ("Deforestation_pct", "Déforestation Moy.", "{:.1f}%"),
+    ("Vulnerability_index_0_100", "Vulnérabilité Moy.", "{:.1f}/100"),
+)
+
+TABS = {
+    "climate": "🌫️ Climat",
+    "ecology": "🌲 Écologie",
+    "energy": "⚡ Énergie & Vulnérabilité",
+}
+
+
+def lazy_tabs():
+    """Onglets paresseux (``GAIA_LAZY_TABS``, activé par défaut)."""
+    return os.getenv("GAIA_LAZY_TABS", "1") != "0"
+
+
+def apply_styles():
+    st.markdown(STYLES, unsafe_allow_html=True)
+
+
+def render_footer():
+    st.markdown('<div class="footer">🌱 Données fictives pour l\'Escape Game pédagogique <b>"Sauver Gaïa"</b> – 2025<br>"Les données racontent l\'avenir, à vous de l\'écrire."</div>', unsafe_allow_html=True)
+
+
+def session_kpis(cube, regions, year_range):
+    """``KpiSet`` de la sélection, tenu à jour pour la session par ``KpiWindow``.
+
+    Tant que les régions ne changent pas, un déplacement du curseur
+    « Période » ne relit que deux lignes de cumuls.
+    """
+    window = st.session_state.get("kpi_window")
+    if window is None or not window.matches(cube, regions):
+        window = st.session_state["kpi_window"] = KpiWindow(cube, regions, KPI_METRICS)
+    return window.kpis(year_range)
+
+
+def render_dashboard(index, cube):
+    # === BARRE LATÉRALE FILTRES ===
+    st.sidebar.markdown('<p class="sidebar-header">🎛️ Filtres</p>', unsafe_allow_html=True)
+    regions = index.regions
+    selected_regions = st.sidebar.multiselect("Choisir les régions :", regions, default=regions)
+    year_range = st.sidebar.slider("Période :", min_value=index.year_min, max_value=index.year_max, value=(2030,2050))
+
+    result = index.lookup(selected_regions, year_range)
+
+    # === EN-TÊTE ===
+    st.markdown('<h1 class="main-header">🌍 Opération Sauver Gaïa</h1>', unsafe_allow_html=True)
+    st.markdown('<p class="subtitle">Tableau de bord environnemental interactif (2030–2050)</p>', unsafe_allow_html=True)
+
+    # === INDICATEURS CLÉS ===
+    st.subheader("📊 Indicateurs globaux")
+    kpis = result.derive("kpis", lambda _: session_kpis(cube, selected_regions, year_range))
+
+    for column, (metric, title, template) in zip(st.columns(len(CARDS)), CARDS):
+        stat = kpis[metric]
+        with column:
+            st.markdown(f'<div class="metric-card"><b>{title}</b><br>{template.format(stat.mean)}</div>', unsafe_allow_html=True)
+
+    # === TÉLÉCHARGEMENT ===
+    # Préparé seulement à la demande, puis gardé avec le résultat du filtre.
+    fmt = st.selectbox("Format d'export :", list(EXPORT_FORMATS), format_func=lambda key: EXPORT_FORMATS[key].label)
+    export_format = EXPORT_FORMATS[fmt]
+    export = result.peek(f"export:{fmt}")
+    if export is None and st.button("📦 Préparer l'export des données filtrées"):
+        export = result.derive(f"export:{fmt}", lambda frame: export_bytes(frame, fmt))
+    if export is not None:
+        st.download_button(
+            f"📥 Télécharger les données filtrées ({export_format.label})",
+            export,
+            f"gaia_data_filtered.{export_format.extension}",
+            export_format.mime,
+        )
+
+    # === ONGLET VISUALISATIONS ===
+    # Une spec par onglet : les lignes partent une fois pour ses deux graphiques.
+    # En mode paresseux, seul l'onglet affiché est construit et envoyé.
+    if lazy_tabs():
+        tab = st.radio("Onglet :", list(TABS), format_func=TABS.get, horizontal=True, label_visibility="collapsed", key="dashboard_tab")
+        spec = result.derive(f"chart:{tab}", lambda frame: build_tab_spec(frame, tab))
+        st.vega_lite_chart(spec=spec, use_container_width=True)
+    else:
+        for container, tab in zip(st.tabs(list(TABS.values())), TABS):
+            with container:
+                spec = result.derive(f"chart:{tab}", lambda frame: build_tab_spec(frame, tab))
+                st.vega_lite_chart(spec=spec, use_container_width=True)
@@ -0,0 +1,219 @@
+# ===============================
+# 📈 Opération Sauver Gaïa - Données climatiques
+# ===============================
+# Fichier : gaia_core/dataset.py
+"""Chargement du jeu de données, mis en cache une fois par processus.
+
+Le DataFrame est partagé par toutes les sessions et toutes les pages : il
+n'est relu que si le fichier change (``mtime``/taille). Les appelants le
+filtrent mais ne le modifient pas. Il est trié par (région, année), les
+régions dans leur ordre d'apparition. Le cube Région × Année des
+indicateurs (``load_cube``) et l'index du filtre de la barre latérale
+(``load_index``) sont construits en même temps et suivent le même cycle
+de vie.
+
+Les colonnes sont typées au plus compact (``SCHEMA``) : ``Region`` en
+catégorie, ``Year`` en ``int16`` et les indicateurs en ``float32`` quand
+leur précision le permet. Une colonne inconnue ou manquante lève
+``DatasetSchemaError``.
+
+Au premier chargement d'un CSV, une copie colonnaire Arrow IPC est écrite
+dans ``.gaia_cache/`` à côté du CSV (ou dans ``GAIA_CACHE_DIR``). Elle est
+identifiée par le hash du contenu du CSV ; un fichier ``.meta.json`` associe
+``(taille, mtime)`` à ce hash pour éviter de relire le CSV. Les chargements
+suivants mappent la copie en mémoire au lieu de reparser le CSV.
+"""
+
+import contextlib
+import glob
+import hashlib
+import json
+import os
+import re
+import threading
+
+import pandas as pd
+import pyarrow as pa
+
+from gaia_core._io import atomic_write, file_token
+from gaia_core.cube import MetricCube
+from gaia_core.filters import FilterIndex, sort_by_region_year
+
+DEFAULT_DATASET_PATH = "better_gaia_dataset.csv"
+
+# float32 garde ~7 chiffres significatifs : assez pour des valeurs à 2 ou 3
+# décimales sous 10 000. Le PIB par habitant (jusqu'à 6 chiffres + centimes)
+# reste en float64.
+SCHEMA = {
+    "Region": "category",
+    "Year": "int16",
+    "CO2_ppm": "float32",
+    "Deforestation_pct": "float32",
+    "SeaLevel_cm": "float32",
+    "Temp_anomaly_C": "float32",
+    "Population_millions": "float32",
+    "GDP_per_capita_USD": "float64",
+    "Renewable_share_pct": "float32",
+    "Industrial_index_0_100": "float32",
+    "Emissions_tCO2_per_capita_est": "float32",
+    "Vulnerability_index_0_100": "float32",
+}
+
+# Décimales du CSV source, pour ré-arrondir les float32 à l'affichage.
+DECIMALS = {
+    "CO2_ppm": 2,
+    "Deforestation_pct": 2,
+    "SeaLevel_cm": 2,
+    "Temp_anomaly_C": 3,
+    "Population_millions": 3,
+    "GDP_per_capita_USD": 2,
+    "Renewable_share_pct": 2,
+    "Industrial_index_0_100": 2,
+    "Emissions_tCO2_per_capita_est": 3,
+    "Vulnerability_index_0_100": 2,
+}
+
+# Change dès que le schéma change : les anciennes copies Arrow sont ignorées.
+_SCHEMA_TAG = hashlib.sha256(json.dumps(SCHEMA, sort_keys=True).encode()).hexdigest()[:8]
+
+SIDECAR_DIR = ".gaia_cache"
+# Fin du nom d'une copie : ``.<hash>.<schéma>.arrow``. Le préfixe seul ne
+# suffit pas : ``gaia.*.arrow`` couvrirait aussi les copies de ``gaia.v2.csv``.
+_SIDECAR_SUFFIX = re.compile(r"\.[0-9a-f]{16}\.[0-9a-f]{8}\.arrow")
+
+_datasets = {}
+_datasets_lock = threading.Lock()
+
+
+class DatasetSchemaError(ValueError):
+    """Les colonnes du CSV ne correspondent pas à ``SCHEMA``."""
+
+
+def dataset_path():
+    return os.getenv("GAIA_DATASET_PATH", DEFAULT_DATASET_PATH)
+
+
+def _read_typed_csv(path):
+    columns = pd.read_csv(path, nrows=0).columns
+    unknown = [c for c in columns if c not in SCHEMA]
+    missing = [c for c in SCHEMA if c not in columns]
+    if unknown or missing:
+        raise DatasetSchemaError(
+            f"{path} : colonnes inconnues {unknown or '∅'}, colonnes manquantes {missing or '∅'}"
+        )
+    return pd.read_csv(path, dtype=SCHEMA)[list(SCHEMA)]
+
+
+def for_display(df):
+    """Copie où les float32 redeviennent des float64 arrondis comme dans le CSV.
+
+    À utiliser pour tout ce qui sérialise des valeurs (graphiques Vega-Lite,
+    JSON) : 401.1 en float32 s'écrirait 401.1000061035156.
+    """
+    out = df.copy()
+    for column in out.columns:
+        if out[column].dtype == "float32":
+            out[column] = out[column].astype("float64").round(DECIMALS.get(column, 6))
+    return out
+
+
+# -------------------------------
+# COPIE ARROW DU CSV
+# -------------------------------
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _sidecar_paths(path):
+    cache_dir = os.getenv("GAIA_CACHE_DIR") or os.path.join(os.path.dirname(os.path.abspath(path)), SIDECAR_DIR)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return cache_dir, os.path.join(cache_dir, stem)
+
+
+def _read_sidecar(sidecar):
+    with pa.memory_map(sidecar) as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+
+def _write_sidecar(sidecar, df):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    def write(f):
+        # Sans compression, pour pouvoir mapper le fichier en mémoire.
+        with pa.ipc.new_file(f, table.schema) as writer:
+            writer.write_table(table)
+
+    atomic_write(sidecar, write, binary=True)
+
+
+def _load_csv(path):
+    """Lit ``path`` via sa copie Arrow, en la (re)construisant si besoin."""
+    cache_dir, base = _sidecar_paths(path)
+    meta_path = base + ".meta.json"
+    st = os.stat(path)
+    key = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+    meta = None
+    with contextlib.suppress(OSError, ValueError):
+        with open(meta_path, encoding="utf-8") as f:
+            meta = json.load(f)
+    if meta is not None and {k: meta.get(k) for k in key} == key:
+        digest = meta["sha256"]
+    else:
+        digest = _file_hash(path)
+    sidecar = f"{base}.{digest[:16]}.{_SCHEMA_TAG}.arrow"
+
+    with contextlib.suppress(OSError, pa.ArrowInvalid):
+        df = _read_sidecar(sidecar)
+        if meta is None or meta.get("sha256") != digest or {k: meta.get(k) for k in key} != key:
+            # Même contenu, fichier seulement touché : on met la clé à jour.
+            with contextlib.suppress(OSError):
+                atomic_write(meta_path, lambda f: json.dump({**key, "sha256": digest}, f))
+        return df
+
+    df = sort_by_region_year(_read_typed_csv(path))
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_sidecar(sidecar, df)
+        atomic_write(meta_path, lambda f: json.dump({**key, "sha256": digest}, f))
+        for stale in glob.glob(glob.escape(base) + ".*.arrow"):
+            if stale != sidecar and _SIDECAR_SUFFIX.fullmatch(stale[len(base):]):
+                with contextlib.suppress(OSError):
+                    os.remove(stale)
+    except OSError:
+        pass  # Dossier en lecture seule : on se passe de la copie.
+    return df
+
+
+# -------------------------------
+# CHARGEMENT PARTAGÉ
+# -------------------------------
+def _load_entry(path):
+    path = path or dataset_path()
+    token = file_token(path)
+    cached = _datasets.get(path)
+    if cached is not None and cached[0] == token:
+        return cached
+    with _datasets_lock:
+        cached = _datasets.get(path)
+        if cached is None or cached[0] != token:
+            # Déjà trié si la copie Arrow vient de cette version : simple vérification.
+            df = sort_by_region_year(_load_csv(path))
+            cached = _datasets[path] = (token, df, MetricCube.from_frame(df), FilterIndex(df))
+    return cached
+
+
+def load_data(path=None):
+    return _load_entry(path)[1]
+
+
+def load_cube(path=None):
+    return _load_entry(path)[2]
+
+
+def load_index(path=None):
+    return _load_entry(path)[3]
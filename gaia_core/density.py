@@ -0,0 +1,73 @@
+# ===============================
+# 🟩 Opération Sauver Gaïa - Nuage de points en densité
+# ===============================
+# Fichier : gaia_core/density.py
+"""Histogramme 2D par région, à la place d'un nuage de points trop dense.
+
+Au-delà de ``GAIA_SCATTER_MAX_POINTS`` lignes, le nuage Énergies
+renouvelables vs Vulnérabilité n'envoie plus un point par ligne mais une
+case par (région, case de la grille) non vide, avec son effectif et les
+moyennes des lignes qu'elle contient. La taille des données ne dépend plus
+que de la grille (``bins`` × ``bins`` cases par région au plus).
+
+Avec beaucoup de régions et peu de lignes par région, presque chaque ligne
+a sa propre case, plus lourde qu'un point : la densité n'est retenue que
+si elle compte au plus ``MAX_CELL_RATIO`` case par ligne (``worth_binning``).
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_POINTS = 5000
+DEFAULT_BINS = 40
+MAX_CELL_RATIO = 0.5
+
+
+def max_scatter_points():
+    return int(os.getenv("GAIA_SCATTER_MAX_POINTS", DEFAULT_MAX_POINTS))
+
+
+def worth_binning(cells, rows):
+    """La densité de ``cells`` cases remplace-t-elle utilement ``rows`` points ?"""
+    return len(cells) <= rows * MAX_CELL_RATIO
+
+
+def binned_density(frame, x, y, bins=DEFAULT_BINS, by="Region"):
+    """Cases non vides de l'histogramme 2D de ``(x, y)`` pour chaque valeur de ``by``.
+
+    Toutes les régions partagent la même grille. Colonnes : ``by``,
+    ``x_start``, ``y_start``, ``count``, ``x_mean``, ``y_mean`` ; la fin
+    d'une case est son début plus le pas de la grille, rangé dans
+    ``attrs["x_step"]`` et ``attrs["y_step"]``.
+    """
+    codes, groups = pd.factorize(frame[by], sort=False)
+    xs = frame[x].to_numpy(dtype=np.float64)
+    ys = frame[y].to_numpy(dtype=np.float64)
+    valid = ~(np.isnan(xs) | np.isnan(ys)) & (codes >= 0)
+    codes, xs, ys = codes[valid], xs[valid], ys[valid]
+    columns = [by, "x_start", "y_start", "count", "x_mean", "y_mean"]
+    if not len(xs):
+        return pd.DataFrame(columns=columns)
+
+    x_edges = np.histogram_bin_edges(xs, bins)
+    y_edges = np.histogram_bin_edges(ys, bins)
+    # Même découpage que ``np.histogram2d`` (dernière case fermée), pour
+    # toutes les régions d'un coup : une clé par (région, case), puis
+    # effectifs et sommes par clé. Seules les cases non vides existent.
+    i = np.clip(np.searchsorted(x_edges, xs, side="right") - 1, 0, bins - 1)
+    j = np.clip(np.searchsorted(y_edges, ys, side="right") - 1, 0, bins - 1)
+    keys, cell = np.unique((codes.astype(np.int64) * bins + i) * bins + j, return_inverse=True)
+    count = np.bincount(cell)
+    region, i, j = keys // (bins * bins), keys // bins % bins, keys % bins
+    cells = pd.DataFrame({
+        by: pd.Categorical.from_codes(region, categories=list(groups)),
+        "x_start": x_edges[i].round(3),
+        "y_start": y_edges[j].round(3),
+        "count": count,
+        "x_mean": (np.bincount(cell, weights=xs) / count).round(2),
+        "y_mean": (np.bincount(cell, weights=ys) / count).round(2),
+    }, columns=columns)
+    cells.attrs.update(x_step=float(x_edges[1] - x_edges[0]), y_step=float(y_edges[1] - y_edges[0]))
+    return cells
@@ -0,0 +1,67 @@
+# ===============================
+# 🪶 Opération Sauver Gaïa - Sous-échantillonnage des courbes
+# ===============================
+# Fichier : gaia_core/downsample.py
+"""Sous-échantillonnage min/max des séries temporelles avant affichage.
+
+Au-delà de ``GAIA_CHART_MAX_POINTS`` points par série (une série = une
+région), chaque série est découpée en paquets de lignes consécutives et
+seules les lignes du minimum et du maximum de chaque paquet sont gardées.
+Le tracé garde ses pics et ses creux, avec au plus ``max_points`` points
+par série, de l'ordre de la largeur en pixels du graphique.
+
+Le calcul est vectorisé sur toutes les séries à la fois (``reduceat`` sur
+les paquets) ; il suppose les lignes groupées par série et dans l'ordre des
+années, ce que garantit ``sort_by_region_year``.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_POINTS = 1000
+
+
+def max_chart_points():
+    return int(os.getenv("GAIA_CHART_MAX_POINTS", DEFAULT_MAX_POINTS))
+
+
+def minmax_downsample(frame, metrics, max_points=None, series="Region"):
+    """Lignes de ``frame`` gardées pour tracer ``metrics``, dans leur ordre.
+
+    Renvoie ``frame`` tel quel si aucune série ne dépasse ``max_points``.
+    Une ligne est gardée si elle porte le minimum ou le maximum de son
+    paquet pour au moins un des indicateurs : les graphiques d'un onglet
+    partagent ainsi les mêmes lignes, d'où ``max_points // (2 × indicateurs)``
+    paquets par série.
+    """
+    max_points = max_points or max_chart_points()
+    n = len(frame)
+    if n <= max_points or not metrics:
+        return frame
+    codes, _ = pd.factorize(frame[series], sort=False)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(codes)) + 1))
+    lengths = np.diff(np.concatenate((starts, [n])))
+    if lengths.max() <= max_points:
+        return frame
+
+    # Paquets par série : une ligne par paquet pour les séries courtes.
+    long = lengths > max_points
+    buckets = np.where(long, max(max_points // (2 * len(metrics)), 1), lengths)
+    position = np.arange(n) - np.repeat(starts, lengths)
+    in_series = np.where(np.repeat(long, lengths), position * np.repeat(buckets, lengths) // np.repeat(lengths, lengths), position)
+    bucket = np.repeat(np.concatenate(([0], np.cumsum(buckets)[:-1])), lengths) + in_series
+    bounds = np.concatenate(([0], np.flatnonzero(np.diff(bucket)) + 1))
+    sizes = np.diff(np.concatenate((bounds, [n])))
+
+    keep = ~np.repeat(long, lengths)
+    for metric in metrics:
+        values = frame[metric].to_numpy(dtype=np.float64)
+        for reduce in (np.fmin, np.fmax):
+            extreme = np.repeat(reduce.reduceat(values, bounds), sizes)
+            hits = np.flatnonzero(values == extreme)
+            # Première ligne atteignant l'extrême dans chaque paquet.
+            _, first = np.unique(bucket[hits], return_index=True)
+            keep[hits[first]] = True
+    return frame.iloc[np.flatnonzero(keep)]
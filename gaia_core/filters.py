@@ -0,0 +1,239 @@
+# ===============================
+# 🔎 Opération Sauver Gaïa - Filtre Région × Année
+# ===============================
+# Fichier : gaia_core/filters.py
+"""Filtre de la barre latérale par tranches contiguës.
+
+Le jeu de données est gardé trié par (région, année), les régions dans
+leur ordre d'apparition dans le CSV. Les lignes d'une région forment donc
+un bloc contigu, et dans ce bloc une fenêtre d'années est elle-même une
+tranche. ``FilterIndex`` garde, pour chaque région, le numéro de la
+première ligne de chaque année : un filtre (régions, [a, b]) se réduit à
+une tranche par région, lue dans ce tableau, sans masque booléen sur
+toute la longueur du jeu de données.
+
+Les résultats sont en plus mémorisés par ``FilterMemo``, partagé par toutes
+les sessions : revenir à une combinaison (régions, période) déjà vue
+réutilise le sous-ensemble et ce qui en a été dérivé (moyennes, CSV,
+graphiques) au lieu de tout recalculer.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Au-delà de cette taille moyenne de tranche, recoller les tranches
+# (copies contiguës) bat la sélection ligne à ligne par ``take``.
+CONCAT_MIN_ROWS = 10_000
+
+DEFAULT_MEMO_BYTES = 64_000_000
+
+
+def sort_by_region_year(df, region="Region", year="Year"):
+    """``df`` trié par (région, année), régions dans l'ordre d'apparition.
+
+    Tri stable ; renvoie ``df`` tel quel s'il est déjà dans cet ordre.
+    """
+    codes, _ = pd.factorize(df[region], sort=False)
+    years = df[year].to_numpy().astype(np.int64)
+    if len(years) < 2:
+        return df
+    years -= years.min()
+    key = codes.astype(np.int64) * (int(years.max()) + 1) + years
+    if bool((key[1:] >= key[:-1]).all()):
+        return df
+    return df.take(np.argsort(key, kind="stable")).reset_index(drop=True)
+
+
+def _nbytes(value, seen=None):
+    """Taille approximative de ``value`` en mémoire, pour le plafond du cache.
+
+    Parcourt dicts et listes (specs de graphiques) ; un même DataFrame
+    référencé plusieurs fois n'est compté qu'une fois.
+    """
+    seen = set() if seen is None else seen
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, (bytes, str)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(_nbytes(k, seen) + _nbytes(v, seen) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(_nbytes(v, seen) for v in value)
+    return sys.getsizeof(value)
+
+
+class FilterResult:
+    """Lignes retenues par un filtre, et les valeurs qui en sont dérivées."""
+
+    def __init__(self, memo, frame):
+        self.frame = frame
+        self.nbytes = _nbytes(frame)
+        self._memo = memo
+        self._derived = {}
+
+    def derive(self, name, build):
+        """Valeur ``name`` calculée une fois par ``build(frame)``, puis réutilisée."""
+        try:
+            return self._derived[name]
+        except KeyError:
+            pass
+        value = build(self.frame)
+        return self._memo._store(self, name, value)
+
+    def peek(self, name):
+        """Valeur ``name`` si elle a déjà été calculée, sinon ``None``."""
+        return self._derived.get(name)
+
+
+class FilterMemo:
+    """Cache LRU des ``FilterResult``, borné en octets (``GAIA_FILTER_CACHE_BYTES``).
+
+    La clé est canonique : l'ordre des régions cochées ne compte pas.
+    """
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes or int(os.getenv("GAIA_FILTER_CACHE_BYTES", DEFAULT_MEMO_BYTES))
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(regions, year_range):
+        return tuple(sorted(set(regions))), (int(year_range[0]), int(year_range[1]))
+
+    def get(self, regions, year_range, select):
+        """Résultat mémorisé du filtre, calculé par ``select(regions, year_range)`` au premier appel."""
+        key = self.key(regions, year_range)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            self.misses += 1
+        result = FilterResult(self, select(regions, year_range))
+        with self._lock:
+            # Une autre session a pu calculer la même clé entre-temps.
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+            self._entries[key] = result
+            self.nbytes += result.nbytes
+            self._evict(keep=result)
+        return result
+
+    def _store(self, result, name, value):
+        with self._lock:
+            if name in result._derived:
+                return result._derived[name]
+            result._derived[name] = value
+            size = _nbytes(value)
+            result.nbytes += size
+            if any(entry is result for entry in self._entries.values()):
+                self.nbytes += size
+                self._evict(keep=result)
+        return value
+
+    def _evict(self, keep):
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            key, oldest = next(iter(self._entries.items()))
+            if oldest is keep:
+                self._entries.move_to_end(key)
+                continue
+            del self._entries[key]
+            self.nbytes -= oldest.nbytes
+            self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self.nbytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+
+class FilterIndex:
+    def __init__(self, df, region="Region", year="Year"):
+        """``df`` doit être trié par ``sort_by_region_year`` ; il n'est pas copié."""
+        self.frame = df
+        codes, regions = pd.factorize(df[region], sort=False)
+        years = df[year].to_numpy().astype(np.int64)
+        self.regions = list(regions)
+        self.year_min = int(years.min()) if len(years) else 0
+        self.year_max = int(years.max()) if len(years) else -1
+        span = self.year_max - self.year_min + 1
+
+        # offsets[r, k] : première ligne de la région r dont l'année est
+        # >= year_min + k ; offsets[r, span] : fin du bloc de la région.
+        counts = np.bincount(codes * span + (years - self.year_min), minlength=len(regions) * span)
+        counts = counts.reshape(len(regions), span)
+        self.offsets = np.zeros((len(regions), span + 1), dtype=np.int64)
+        np.cumsum(counts, axis=1, out=self.offsets[:, 1:])
+        starts = np.concatenate(([0], np.cumsum(self.offsets[:, -1])[:-1]))
+        self.offsets += starts[:, None]
+        self._region_index = {r: i for i, r in enumerate(self.regions)}
+        self.memo = FilterMemo()
+
+    def ranges(self, regions, year_range):
+        """Tranches ``[(début, fin)]`` des lignes retenues, dans l'ordre du jeu de données.
+
+        Les tranches adjacentes sont fusionnées.
+        """
+        positions = sorted({self._region_index[r] for r in regions if r in self._region_index})
+        span = self.offsets.shape[1] - 1
+        first = min(max(year_range[0] - self.year_min, 0), span)
+        last = min(max(year_range[1] - self.year_min + 1, 0), span)
+        if not positions or first >= last:
+            return []
+        merged = []
+        for start, stop in zip(self.offsets[positions, first].tolist(), self.offsets[positions, last].tolist()):
+            if start == stop:
+                continue
+            if merged and merged[-1][1] == start:
+                merged[-1] = (merged[-1][0], stop)
+            else:
+                merged.append((start, stop))
+        return merged
+
+    def select(self, regions, year_range):
+        """Lignes des ``regions`` dont l'année est dans ``year_range`` (bornes incluses).
+
+        Même résultat que le masque ``isin`` + ``between`` (ordre et index
+        compris). Une seule tranche, par exemple une région seule ou toutes
+        les régions sur toutes les années, est renvoyée sans copie.
+        """
+        ranges = self.ranges(regions, year_range)
+        if not ranges:
+            return self.frame.iloc[0:0]
+        if len(ranges) == 1:
+            return self.frame.iloc[ranges[0][0]:ranges[0][1]]
+        starts, stops = np.array(ranges).T
+        lengths = stops - starts
+        if lengths.sum() >= CONCAT_MIN_ROWS * len(ranges):
+            return pd.concat([self.frame.iloc[start:stop] for start, stop in ranges])
+        rows = np.arange(lengths.sum()) + np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        return self.frame.take(rows)
+
+    def lookup(self, regions, year_range):
+        """``FilterResult`` mémorisé pour cette sélection (voir ``FilterMemo``)."""
+        return self.memo.get(regions, year_range, self.select)
@@ -0,0 +1,68 @@
+# ===============================
+# 📊 Opération Sauver Gaïa - Indicateurs clés
+# ===============================
+# Fichier : gaia_core/kpi.py
+"""Statistiques des cartes d'indicateurs, calculées ensemble.
+
+``KpiSet`` regroupe, pour chaque indicateur, l'effectif (valeurs non
+manquantes), la somme et la moyenne. Il se calcule d'un coup pour tous les
+indicateurs à partir des sommes cumulées du cube Région × Année, sans
+repasser par les lignes. Les cartes du tableau de bord affichent la
+moyenne.
+
+``KpiWindow`` suit une session pendant que le curseur « Période » bouge :
+tant que les régions ne changent pas, chaque fenêtre se lit en deux
+lectures par indicateur.
+"""
+
+from collections import namedtuple
+from dataclasses import dataclass
+
+import numpy as np
+
+KPI_METRICS = ("CO2_ppm", "Temp_anomaly_C", "Deforestation_pct", "Vulnerability_index_0_100")
+
+KpiStat = namedtuple("KpiStat", "count total mean")
+
+
+@dataclass(frozen=True)
+class KpiSet:
+    metrics: tuple
+    count: np.ndarray  # int64, une valeur par indicateur
+    total: np.ndarray  # float64
+
+    @property
+    def mean(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.total / self.count
+
+    def __getitem__(self, metric):
+        i = self.metrics.index(metric)
+        return KpiStat(int(self.count[i]), float(self.total[i]), float(self.mean[i]))
+
+
+class KpiWindow:
+    """Statistiques d'une sélection de régions, pour n'importe quelle fenêtre d'années.
+
+    Les cumuls le long des années des régions choisies sont additionnés une
+    fois (``MetricCube.selection_cumsums``) ; ils ne sont recalculés que si
+    les régions ou le cube changent. Ensuite, ``kpis`` tire effectifs et
+    sommes d'une fenêtre de la différence de deux lignes de ces cumuls : le
+    coût ne dépend ni de la largeur de la fenêtre ni du volume de données.
+    """
+
+    def __init__(self, cube, regions, metrics=KPI_METRICS):
+        self.cube = cube
+        self.regions = tuple(regions)
+        self.metrics = tuple(metrics)
+        self._counts, self._sums = cube.selection_cumsums(self.regions, self.metrics)
+
+    def matches(self, cube, regions):
+        return self.cube is cube and self.regions == tuple(regions)
+
+    def kpis(self, year_range):
+        """``KpiSet`` de la fenêtre ``year_range`` (bornes incluses)."""
+        window = self.cube._year_slice(year_range)
+        count = self._counts[window.stop] - self._counts[window.start]
+        total = self._sums[window.stop] - self._sums[window.start]
+        return KpiSet(self.metrics, count, np.where(count == 0, 0.0, total))
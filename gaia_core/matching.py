@@ -0,0 +1,126 @@
+# ===============================
+# 🔤 Opération Sauver Gaïa - Comparaison des réponses
+# ===============================
+# Fichier : gaia_core/matching.py
+"""Comparaison tolérante des réponses texte des équipes.
+
+Une réponse est repliée (minuscules, sans accents ni ponctuation), découpée
+en mots, débarrassée des articles, et chaque mot est réduit à une racine
+par une racinisation légère du français (pluriel, féminin, -ement, -ation,
+terminaisons verbales courantes). « La région Archipel », « archipels »,
+« ARCHIPEL ! » donnent ainsi la même forme.
+
+``AnswerMatcher`` précalcule ces formes pour les réponses acceptées d'une
+mission : une réponse correcte à l'orthographe près se vérifie par une
+lecture dans un ensemble. Sinon, une distance d'édition bornée (une faute
+jusqu'à 7 lettres, deux au-delà, aucune pour les mots courts) rattrape les
+fautes de frappe, en comparant seulement aux formes de longueur voisine.
+"""
+
+import re
+import unicodedata
+
+STOPWORDS = frozenset(("l", "le", "la", "les", "un", "une", "d", "de", "du", "des", "region", "regions"))
+
+# Du plus long au plus court ; une racine garde au moins 4 lettres.
+SUFFIXES = ("ements", "ement", "ations", "ation", "ments", "ment", "ees", "ent", "ee", "es", "er", "ez", "e", "s", "x")
+MIN_STEM = 4
+
+# Réponses libres (``contains=True``) : un mot n'est rapproché d'un mot-clé
+# par distance d'édition que si la racine du mot-clé a au moins
+# ``FUZZY_MIN_STEM`` lettres et que le mot commence par les mêmes
+# ``FUZZY_PREFIX`` lettres. Sans ces gardes, « caisse », « laisse » ou
+# « basses » passeraient pour « baisse », « univers » pour « inverse ».
+FUZZY_MIN_STEM = 6
+FUZZY_PREFIX = 2
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def fold(text):
+    """Minuscules sans accents : ``"Réponse Élevée"`` → ``"reponse elevee"``."""
+    text = unicodedata.normalize("NFKD", str(text).casefold())
+    return "".join(c for c in text if not unicodedata.combining(c))
+
+
+def stem(word):
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM:
+            return word[:-len(suffix)]
+    return word
+
+
+def stems(text):
+    """Racines des mots de ``text``, articles exclus."""
+    return [stem(word) for word in _WORD.findall(fold(text)) if word not in STOPWORDS]
+
+
+def tolerance(form):
+    """Fautes admises pour une forme : 0 jusqu'à 4 lettres, 1 jusqu'à 7, 2 au-delà."""
+    return 0 if len(form) <= 4 else 1 if len(form) <= 7 else 2
+
+
+def edit_distance(a, b, bound):
+    """Distance d'édition (transpositions comprises) de ``a`` à ``b``, ou ``bound + 1`` si elle dépasse ``bound``."""
+    # Bornes inférieures gratuites : chaque édition change la longueur d'au
+    # plus 1 et l'ensemble des lettres d'au plus 2.
+    if abs(len(a) - len(b)) > bound or len(set(a) ^ set(b)) > 2 * bound:
+        return bound + 1
+    # Seule la bande |i - j| <= bound peut rester sous la borne.
+    far = bound + 1
+    before, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [far] * (len(b) + 1)
+        current[0] = i
+        low, high = max(1, i - bound), min(len(b), i + bound)
+        for j in range(low, high + 1):
+            d = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (a[i - 1] != b[j - 1]))
+            if before is not None and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                d = min(d, before[j - 2] + 1)
+            current[j] = d
+        if min(current[low - 1:high + 1]) > bound:
+            return far
+        before, previous = previous, current
+    return min(previous[-1], far)
+
+
+class AnswerMatcher:
+    """Réponses acceptées d'une mission, sous forme normalisée.
+
+    Par défaut, toute la réponse doit correspondre à une des réponses
+    acceptées. Avec ``contains=True``, il suffit qu'un de ses mots
+    corresponde à un des mots-clés (ou qu'un mot-clé y apparaisse tel quel,
+    comme le faisait l'ancien test ``"inverse" in réponse``) ; les fautes de
+    frappe n'y sont tolérées que sous les gardes ``FUZZY_MIN_STEM`` et
+    ``FUZZY_PREFIX``.
+    """
+
+    def __init__(self, accepted, contains=False):
+        self.contains = contains
+        if contains:
+            words = {word for answer in accepted for word in _WORD.findall(fold(answer))}
+            self._pattern = re.compile("|".join(re.escape(word) for word in sorted(words, key=len, reverse=True)))
+            self._forms = frozenset(stem(word) for word in words)
+        else:
+            self._forms = frozenset(" ".join(stems(answer)) for answer in accepted)
+        # Formes comparées par distance d'édition, avec leur tolérance.
+        self._fuzzy = tuple(
+            (form, tolerance(form)) for form in self._forms
+            if tolerance(form) and (not contains or len(form) >= FUZZY_MIN_STEM)
+        )
+
+    def _close(self, form):
+        return any(
+            edit_distance(form, target, bound) <= bound
+            for target, bound in self._fuzzy
+            if not self.contains or form[:FUZZY_PREFIX] == target[:FUZZY_PREFIX]
+        )
+
+    def __call__(self, answer):
+        if not self.contains:
+            form = " ".join(stems(answer))
+            return form in self._forms or self._close(form)
+        if self._pattern.search(fold(answer)):
+            return True
+        words = stems(answer)
+        return any(word in self._forms for word in words) or any(self._close(word) for word in words)
@@ -0,0 +1,210 @@
+# ===============================
+# 🚀 Opération Sauver Gaïa - Missions
+# ===============================
+# Fichier : gaia_core/missions.py
+"""Moteur de missions partagé par l'espace Équipe de ``app.py`` et ``gaia_team_app.py``.
+
+Les missions sont déclarées dans ``missions.json`` (ou le fichier de
+``GAIA_MISSIONS_PATH``) : objectif, indice, widget, validateur, points et
+mission suivante. Le fichier est lu et compilé une fois, à l'import : chaque
+validateur devient une fonction, avec ses mots-clés déjà normalisés et ses
+expressions régulières déjà compilées. Un rerun ne fait plus qu'un appel.
+Les réponses texte sont comparées par ``gaia_core.matching`` : sans tenir
+compte des accents, de la casse, des articles ni des fautes de frappe
+légères.
+
+Validateurs (clé ``validator``, selon ``type``) :
+
+- ``keywords`` : ``words``, comparés à la réponse ; ``match`` vaut
+  ``exact`` (par défaut) ou ``contains`` (un des mots apparaît dans la
+  réponse) ;
+- ``regex`` : ``pattern`` trouvé dans la réponse, sans tenir compte de la
+  casse ;
+- ``equals`` : réponse égale à ``value`` ;
+- ``longer_than`` : réponse de plus de ``value`` caractères ;
+- ``answer_key`` : réponse calculée sur le jeu de données par la requête
+  ``query`` de ``gaia_core.answers`` (paramètres ``args``).
+
+Avec ``"year_bounds": true``, un ``number_input`` est borné par la première
+et la dernière année du jeu de données chargé.
+"""
+
+import functools
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from gaia_core.answers import QUERIES, dataset_years, expected_answer, register
+from gaia_core.matching import AnswerMatcher
+from gaia_core.progress import update_progress
+
+DEFAULT_MISSIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "missions.json")
+
+WIDGETS = ("text_input", "text_area", "number_input")
+
+
+class MissionSpecError(ValueError):
+    """Le fichier des missions est mal formé."""
+
+
+@dataclass(frozen=True)
+class Mission:
+    number: int
+    objective: str
+    widget: str  # "text_input", "text_area" ou "number_input"
+    label: str
+    button: str
+    points: int
+    validate: Callable[[object], bool]
+    success: str
+    failure: str
+    failure_level: str = "error"  # "error" ou "warning"
+    next_mission: Optional[int] = None
+    widget_args: dict = field(default_factory=dict)
+    year_bounds: bool = False
+    answer_key: Optional[tuple] = None  # clé ``register`` d'un validateur ``answer_key``
+
+    def widget_kwargs(self):
+        """Arguments du widget de saisie, bornes d'années du jeu de données comprises."""
+        if not self.year_bounds:
+            return self.widget_args
+        first, last = dataset_years()
+        return {**self.widget_args, "min_value": first, "max_value": last}
+
+
+def missions_path():
+    return os.getenv("GAIA_MISSIONS_PATH", DEFAULT_MISSIONS_PATH)
+
+
+def _keywords(spec):
+    match = spec.get("match", "exact")
+    if match not in ("exact", "contains"):
+        raise MissionSpecError(f"match inconnu : {match!r} (attendu : exact, contains)")
+    return AnswerMatcher(spec["words"], contains=match == "contains")
+
+
+def _regex(spec):
+    pattern = re.compile(spec["pattern"], re.IGNORECASE)
+    return lambda answer: pattern.search(str(answer)) is not None
+
+
+def _equals(spec):
+    value = spec["value"]
+    return lambda answer: answer == value
+
+
+def _longer_than(spec):
+    length = spec["value"]
+    return lambda answer: len(answer) > length
+
+
+def _answer_key(spec):
+    query, args = spec["query"], spec.get("args", {})
+    if query not in QUERIES:
+        raise MissionSpecError(f"Requête inconnue : {query!r} (attendu : {', '.join(QUERIES)})")
+    key = register(query, args)
+    # Un comparateur par réponse attendue, c'est-à-dire par jeu de données.
+    matcher = functools.lru_cache(maxsize=8)(lambda expected: AnswerMatcher((expected,)))
+
+    def validate(answer):
+        expected = expected_answer(key)
+        if isinstance(expected, str):
+            return matcher(expected)(answer)
+        return answer == expected
+
+    validate.answer_key = key
+    return validate
+
+
+VALIDATORS = {
+    "keywords": _keywords,
+    "regex": _regex,
+    "equals": _equals,
+    "longer_than": _longer_than,
+    "answer_key": _answer_key,
+}
+
+
+def compile_validator(spec):
+    """Fonction ``réponse -> bool`` décrite par ``spec`` (voir la docstring du module)."""
+    kind = spec.get("type")
+    if kind not in VALIDATORS:
+        raise MissionSpecError(f"Validateur inconnu : {kind!r} (attendu : {', '.join(VALIDATORS)})")
+    return VALIDATORS[kind](spec)
+
+
+def compile_missions(spec):
+    """``({numéro: Mission}, {numéro: indice})`` à partir du contenu de ``missions.json``."""
+    missions, hints = {}, {}
+    for entry in spec["missions"]:
+        number = entry["number"]
+        if entry["widget"] not in WIDGETS:
+            raise MissionSpecError(f"Mission {number} : widget inconnu {entry['widget']!r} (attendu : {', '.join(WIDGETS)})")
+        validate = compile_validator(entry["validator"])
+        missions[number] = Mission(
+            number=number,
+            objective=entry["objective"],
+            widget=entry["widget"],
+            label=entry["label"],
+            button=entry["button"],
+            points=entry["points"],
+            validate=validate,
+            success=entry["success"],
+            failure=entry["failure"],
+            failure_level=entry.get("failure_level", "error"),
+            next_mission=entry.get("next"),
+            widget_args=entry.get("widget_args", {}),
+            year_bounds=entry.get("year_bounds", False),
+            answer_key=getattr(validate, "answer_key", None),
+        )
+        if "hint" in entry:
+            hints[number] = entry["hint"]
+    if not missions:
+        raise MissionSpecError("Aucune mission déclarée")
+    for mission in missions.values():
+        if mission.next_mission is not None and mission.next_mission not in missions:
+            raise MissionSpecError(f"Mission {mission.number} : mission suivante {mission.next_mission} introuvable")
+    return missions, hints
+
+
+def load_missions(path=None):
+    path = path or missions_path()
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    try:
+        missions, hints = compile_missions(spec)
+    except (KeyError, TypeError, re.error) as exc:
+        raise MissionSpecError(f"{path} : {exc!r}") from exc
+    return spec, missions, hints
+
+
+_spec, MISSIONS, HINTS = load_missions()
+# Bornes des numéros de mission : première mission d'une nouvelle équipe,
+# plage du réglage manuel de l'Admin.
+FIRST_MISSION, LAST_MISSION = min(MISSIONS), max(MISSIONS)
+FINAL_HINT = _spec["final_hint"]
+LOW_SCORE_HINT = _spec["low_score_hint"]
+DEFAULT_HINT = _spec["default_hint"]
+
+
+def get_hint(mission, score):
+    if score < 20:
+        return LOW_SCORE_HINT
+    return HINTS.get(mission, DEFAULT_HINT)
+
+
+def submit_answer(team, mission, score, answer, game=None):
+    """Valide la réponse et enregistre la progression de l'équipe dans ``game``.
+
+    Retourne ``(ok, mission, score)`` après la tentative.
+    """
+    if not mission.validate(answer):
+        return False, mission.number, score
+    score += mission.points
+    if mission.next_mission is None:
+        update_progress(team, mission.number, score, FINAL_HINT, game=game)
+        return True, mission.number, score
+    update_progress(team, mission.next_mission, score, get_hint(mission.next_mission, score), game=game)
+    return True, mission.next_mission, score
@@ -0,0 +1,701 @@
+# ===============================
+# 💾 Opération Sauver Gaïa - Progression des équipes
+# ===============================
+# Fichier : gaia_core/progress.py
+"""Stockage partagé de la progression des équipes.
+
+Par défaut la progression vit dans une base SQLite en mode WAL : chaque
+réponse est un upsert d'une seule ligne (clé ``Team``) au lieu d'une
+réécriture complète du fichier, et les lecteurs ne bloquent jamais les
+écrivains. ``GAIA_PROGRESS_BACKEND=csv`` conserve l'ancien ``progress.csv``,
+protégé par un verrou et publié par remplacement atomique.
+``GAIA_PROGRESS_BACKEND=journal`` ajoute chaque changement d'état à un
+journal d'événements (historique complet, écriture en O(1)).
+
+Import ponctuel d'un ancien ``progress.csv`` :
+
+    python -m gaia_core import progress.csv
+
+Compaction manuelle du journal :
+
+    python -m gaia_core compact
+"""
+
+import abc
+import atexit
+import contextlib
+import datetime
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from gaia_core._io import atomic_write, file_token, flock
+
+COLUMNS = ["Team", "Mission", "Score", "Hint", "Last_Update"]
+
+DEFAULT_PROGRESS_PATHS = {"sqlite": "progress.db", "csv": "progress.csv", "journal": "progress.journal"}
+
+DEFAULT_WRITE_BEHIND_MS = 200
+
+DEFAULT_GAME = "default"
+
+GAME_ID_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------
+# ÉVÉNEMENTS ET INDEX DES ÉQUIPES
+# -------------------------------
+def _event(kind, **fields):
+    return {"ts": datetime.datetime.now().isoformat(timespec="seconds"), "type": kind, **fields}
+
+
+def _apply_event(index, event):
+    """Applique un événement à l'index ``{équipe: ligne}`` en O(1).
+
+    Les événements portent des valeurs absolues : rejouer deux fois le même
+    événement (reprise après une compaction interrompue) est sans effet.
+    """
+    kind = event["type"]
+    if kind == "reset":
+        index.clear()
+        return
+    team = event["team"]
+    stamp = event["ts"][11:19]
+    if kind == "answer":
+        index[team] = {
+            "Team": team,
+            "Mission": event["mission"],
+            "Score": event["score"],
+            "Hint": event["hint"],
+            "Last_Update": stamp,
+        }
+        return
+    record = index.get(team)
+    if record is None:
+        return
+    if kind == "hint":
+        record.update(Hint=event["hint"], Last_Update=stamp)
+    elif kind == "adjust":
+        record.update(Score=event["score"], Mission=event["mission"], Last_Update=stamp)
+
+
+def partition_path(path, game):
+    """Fichier d'une partie : ``progress.csv`` → ``progress.<partie>.csv``."""
+    if game == DEFAULT_GAME:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{game}{ext}"
+
+
+def _index_from_rows(rows):
+    return {row[0]: dict(zip(COLUMNS, row)) for row in rows}
+
+
+class _IndexedProgress(abc.ABC):
+    """Index de processus ``{équipe: ligne}``, partagé par toutes les sessions.
+
+    ``get(team)`` est une recherche dans un dict et les écritures locales
+    mettent l'index à jour en O(1). L'index n'est relu depuis le stockage
+    que si le jeton de version change sans qu'on en soit l'auteur
+    (``mtime``/taille du fichier, ou compteur de version SQLite) : un rerun
+    d'une équipe inactive ne coûte qu'un ``os.stat``. Le DataFrame de
+    ``load()`` est reconstruit à la demande, partagé, et ne doit pas être
+    modifié par l'appelant.
+    """
+
+    def _init_index(self):
+        self._index = {}
+        self._token = object()
+        self._frame = None
+        self._index_lock = threading.RLock()
+        self._write_behind = None
+
+    @abc.abstractmethod
+    def _version_token(self):
+        """Jeton qui change à chaque modification du stockage."""
+
+    @abc.abstractmethod
+    def _read_index(self):
+        """Retourne l'index complet (ou rattrapé) depuis le stockage."""
+
+    @abc.abstractmethod
+    def _write_events(self, events):
+        """Écrit un lot d'événements, dans l'ordre, en une seule transaction."""
+
+    def _sync(self):
+        token = self._version_token()
+        if token == self._token:
+            return
+        with self._index_lock:
+            # Jeton lu avant la lecture : une écriture concurrente ne peut
+            # que provoquer une relecture de trop, jamais un état périmé.
+            self._index = self._read_index()
+            self._token = token
+            self._frame = None
+
+    def _apply_local(self, before, after, events):
+        """Reporte nos propres écritures dans l'index sans relire le stockage."""
+        with self._index_lock:
+            if self._token == before:
+                for event in events:
+                    _apply_event(self._index, event)
+                self._token = after
+                self._frame = None
+
+    def _writer(self):
+        """File d'écriture différée, créée au premier usage (``None`` si désactivée)."""
+        if self._write_behind is None:
+            with self._index_lock:
+                if self._write_behind is None:
+                    interval_ms = int(os.getenv("GAIA_WRITE_BEHIND_MS", DEFAULT_WRITE_BEHIND_MS))
+                    self._write_behind = WriteBehindQueue(self, interval_ms) if interval_ms > 0 else False
+        return self._write_behind or None
+
+    def flush(self):
+        """Écrit les réponses en attente et attend la fin de l'écriture."""
+        writer = self._writer()
+        if writer is not None:
+            writer.flush()
+
+    def load(self):
+        self._sync()
+        frame = self._frame
+        if frame is None:
+            with self._index_lock:
+                frame = self._frame = pd.DataFrame(list(self._index.values()), columns=COLUMNS)
+        return frame
+
+    def get(self, team):
+        # Une réponse encore dans la file d'écriture fait foi : l'équipe voit
+        # sa nouvelle mission dès le rerun qui suit sa validation.
+        writer = self._writer()
+        pending = writer.pending(team) if writer is not None else None
+        if pending is not None:
+            record = {}
+            _apply_event(record, pending)
+            return record[team]
+        self._sync()
+        record = self._index.get(team)
+        return dict(record) if record else None
+
+    def update_progress(self, team, mission, score, hint):
+        event = _event("answer", team=team, mission=int(mission), score=int(score), hint=hint or "")
+        writer = self._writer()
+        if writer is not None:
+            writer.submit(event)
+        else:
+            self._write_events([event])
+
+    # Les actions d'administration sont synchrones et vident d'abord la file :
+    # une réponse en attente ne peut pas écraser un indice ou une remise à zéro.
+    def send_hint(self, team, hint):
+        self.flush()
+        self._write_events([_event("hint", team=team, hint=hint)])
+
+    def adjust(self, team, score, mission):
+        self.flush()
+        self._write_events([_event("adjust", team=team, score=int(score), mission=int(mission))])
+
+    def reset(self):
+        self.flush()
+        self._write_events([_event("reset")])
+
+
+# -------------------------------
+# FILE D'ÉCRITURE DIFFÉRÉE
+# -------------------------------
+class WriteBehindQueue:
+    """Écrit les réponses des équipes en arrière-plan, par lots.
+
+    ``submit`` rend la main immédiatement ; un thread écrit toutes les
+    ``interval_ms`` millisecondes les réponses accumulées en une seule
+    transaction. Plusieurs réponses d'une même équipe sont fusionnées (la
+    dernière gagne, chaque réponse portant l'état complet de l'équipe).
+    La file est vidée à l'arrêt du processus. Un lot en cours d'écriture
+    reste visible par ``pending`` jusqu'à la fin de la transaction : une
+    équipe qui relance sa page pendant l'écriture ne revoit pas son ancienne
+    mission.
+    """
+
+    def __init__(self, store, interval_ms):
+        self.store = store
+        self.interval = interval_ms / 1000
+        self._pending = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="gaia-write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def submit(self, event):
+        with self._lock:
+            self._pending.pop(event["team"], None)
+            self._pending[event["team"]] = event
+        self._wakeup.set()
+
+    def pending(self, team):
+        with self._lock:
+            return self._pending.get(team) or self._in_flight.get(team)
+
+    def flush(self):
+        """Écrit tout ce qui est en attente ; retourne une fois l'écriture faite."""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._in_flight = batch
+            if not batch:
+                return
+            try:
+                self.store._write_events(list(batch.values()))
+            except BaseException:
+                # On remet le lot en file, sans écraser une réponse plus récente.
+                with self._lock:
+                    self._pending = {**batch, **self._pending}
+                    self._in_flight = {}
+                raise
+            with self._lock:
+                self._in_flight = {}
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            time.sleep(self.interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Échec de l'écriture différée de la progression ; nouvel essai.")
+                self._wakeup.set()
+
+
+# -------------------------------
+# STOCKAGE SQLITE (WAL)
+# -------------------------------
+_SQL_UPSERT = """
+    INSERT INTO progress (game_id, team, mission, score, hint, last_update)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT(game_id, team) DO UPDATE SET
+        mission = excluded.mission,
+        score = excluded.score,
+        hint = excluded.hint,
+        last_update = excluded.last_update
+"""
+
+_SCHEMA_VERSION = 2
+
+_SQLITE_HEADER = b"SQLite format 3\x00"
+
+_SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS progress (
+        game_id     TEXT NOT NULL,
+        team        TEXT NOT NULL,
+        mission     INTEGER NOT NULL,
+        score       INTEGER NOT NULL,
+        hint        TEXT NOT NULL DEFAULT '',
+        last_update TEXT NOT NULL DEFAULT '',
+        PRIMARY KEY (game_id, team)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS meta (
+        game_id TEXT PRIMARY KEY,
+        version INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS progress_version_insert AFTER INSERT ON progress BEGIN
+        INSERT OR IGNORE INTO meta (game_id, version) VALUES (NEW.game_id, 0);
+        UPDATE meta SET version = version + 1 WHERE game_id = NEW.game_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS progress_version_update AFTER UPDATE ON progress BEGIN
+        UPDATE meta SET version = version + 1 WHERE game_id = OLD.game_id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS progress_version_delete AFTER DELETE ON progress BEGIN
+        UPDATE meta SET version = version + 1 WHERE game_id = OLD.game_id;
+    END
+    """,
+]
+
+# Première version du schéma : une seule partie, clé ``team``.
+_MIGRATE_FROM_V1 = [
+    "DROP TRIGGER IF EXISTS progress_version_insert",
+    "DROP TRIGGER IF EXISTS progress_version_update",
+    "DROP TRIGGER IF EXISTS progress_version_delete",
+    "DROP TABLE IF EXISTS meta",
+    "ALTER TABLE progress RENAME TO progress_v1",
+    *_SCHEMA,
+    f"""
+    INSERT INTO progress (game_id, team, mission, score, hint, last_update)
+    SELECT '{DEFAULT_GAME}', team, mission, score, hint, last_update FROM progress_v1 ORDER BY rowid
+    """,
+    "DROP TABLE progress_v1",
+]
+
+# Connexions partagées par toutes les parties et tous les threads : une par
+# fichier et par processus. Streamlit lance chaque rerun dans un nouveau
+# thread ; une connexion par thread serait rouverte (PRAGMA compris) à
+# presque chaque interaction. Chaque connexion a son verrou, tenu pendant
+# toute requête ou transaction.
+_connections = {}
+_connections_lock = threading.Lock()
+
+
+def _connect(path):
+    """``(connexion, verrou)`` partagés du fichier ``path``, ouverts au premier usage."""
+    entry = _connections.get(path)
+    if entry is None:
+        with _connections_lock:
+            entry = _connections.get(path)
+            if entry is None:
+                conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute("PRAGMA busy_timeout=30000")
+                entry = _connections[path] = (conn, threading.Lock())
+    return entry
+
+
+class SQLiteProgressStore(_IndexedProgress):
+    """Progression d'une partie, stockée dans une table SQLite indexée sur
+    ``(game_id, team)``.
+
+    Des triggers incrémentent ``meta.version`` de la partie à chaque
+    modification : c'est le jeton de version de l'index en mémoire, et
+    l'activité d'une autre partie ne l'invalide pas.
+    """
+
+    def __init__(self, path, game=DEFAULT_GAME):
+        self.path = path
+        self.game = game
+        self._init_index()
+        with contextlib.suppress(FileNotFoundError), open(path, "rb") as f:
+            header = f.read(len(_SQLITE_HEADER))
+            if header and header != _SQLITE_HEADER:
+                raise ValueError(
+                    f"{path} n'est pas une base SQLite (ancien progress.csv ?) : utiliser "
+                    f"GAIA_PROGRESS_BACKEND=csv, ou l'importer avec « python -m gaia_core import {path} » "
+                    f"et pointer GAIA_PROGRESS_PATH vers la base (par défaut progress.db)."
+                )
+        with self._transaction() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(progress)")}
+                for statement in _MIGRATE_FROM_V1 if columns and "game_id" not in columns else _SCHEMA:
+                    conn.execute(statement)
+                conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    @contextlib.contextmanager
+    def _connection(self):
+        conn, lock = _connect(self.path)
+        with lock:
+            yield conn
+
+    @contextlib.contextmanager
+    def _transaction(self):
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _version_token(self, conn=None):
+        if conn is None:
+            with self._connection() as conn:
+                return self._version_token(conn)
+        row = conn.execute("SELECT version FROM meta WHERE game_id = ?", (self.game,)).fetchone()
+        return row[0] if row else 0
+
+    def _read_index(self):
+        with self._connection() as conn:
+            return _index_from_rows(
+                conn.execute(
+                    "SELECT team, mission, score, hint, last_update FROM progress WHERE game_id = ? ORDER BY rowid",
+                    (self.game,),
+                )
+            )
+
+    def _write_events(self, events):
+        game = self.game
+        with self._transaction() as conn:
+            before = self._version_token(conn)
+            for event in events:
+                kind, stamp = event["type"], event["ts"][11:19]
+                if kind == "answer":
+                    conn.execute(
+                        _SQL_UPSERT, (game, event["team"], event["mission"], event["score"], event["hint"], stamp)
+                    )
+                elif kind == "hint":
+                    conn.execute(
+                        "UPDATE progress SET hint = ?, last_update = ? WHERE game_id = ? AND team = ?",
+                        (event["hint"], stamp, game, event["team"]),
+                    )
+                elif kind == "adjust":
+                    conn.execute(
+                        "UPDATE progress SET score = ?, mission = ?, last_update = ? WHERE game_id = ? AND team = ?",
+                        (event["score"], event["mission"], stamp, game, event["team"]),
+                    )
+                elif kind == "reset":
+                    conn.execute("DELETE FROM progress WHERE game_id = ?", (game,))
+            after = self._version_token(conn)
+        self._apply_local(before, after, events)
+
+    def import_csv(self, csv_path):
+        """Importe un ancien ``progress.csv`` dans la partie ; les équipes existantes sont écrasées."""
+        legacy = pd.read_csv(csv_path).fillna({"Hint": "", "Last_Update": ""})
+        rows = [
+            (self.game, str(r.Team), int(r.Mission), int(r.Score), str(r.Hint), str(r.Last_Update))
+            for r in legacy.itertuples(index=False)
+        ]
+        with self._transaction() as conn:
+            conn.executemany(_SQL_UPSERT, rows)
+        return len(rows)
+
+
+# -------------------------------
+# STOCKAGE CSV (VERROU + REMPLACEMENT ATOMIQUE)
+# -------------------------------
+class CSVProgressStore(_IndexedProgress):
+    """Progression dans un CSV, pour les sites qui ne peuvent pas passer à SQLite.
+
+    Chaque écriture garde un verrou ``fcntl`` exclusif sur ``<fichier>.lock``
+    pendant tout le cycle lecture-modification-écriture, puis publie le
+    nouveau contenu via un fichier temporaire et ``os.replace`` : un lecteur
+    voit toujours l'ancienne ou la nouvelle version complète, jamais un
+    fichier à moitié écrit.
+    """
+
+    def __init__(self, path, game=DEFAULT_GAME):
+        self.game = game
+        self.path = path = partition_path(path, game)
+        self.lock_path = path + ".lock"
+        self._thread_lock = threading.Lock()
+        self._init_index()
+        with self._locked():
+            if not os.path.exists(self.path):
+                self._write({})
+
+    @contextlib.contextmanager
+    def _locked(self):
+        # Le verrou fcntl est par processus : on sérialise aussi les threads.
+        with self._thread_lock, flock(self.lock_path):
+            yield
+
+    def _version_token(self):
+        # os.replace change l'inode : chaque publication invalide l'index.
+        return file_token(self.path)
+
+    def _read_index(self):
+        df = pd.read_csv(self.path, dtype={"Team": str}, keep_default_na=False)
+        return _index_from_rows(df[COLUMNS].itertuples(index=False, name=None))
+
+    def _write(self, index):
+        df = pd.DataFrame(list(index.values()), columns=COLUMNS)
+        atomic_write(self.path, lambda tmp: df.to_csv(tmp, index=False))
+
+    def _write_events(self, events):
+        with self._locked():
+            before = self._version_token()
+            # Copie ligne par ligne : ``_apply_event`` modifie les lignes en
+            # place, et l'index ne doit changer que si l'écriture réussit.
+            index = self._read_index() if before != self._token else {team: dict(record) for team, record in self._index.items()}
+            for event in events:
+                _apply_event(index, event)
+            self._write(index)
+            after = self._version_token()
+            with self._index_lock:
+                self._index, self._token, self._frame = index, after, None
+
+
+# -------------------------------
+# JOURNAL D'ÉVÉNEMENTS + INSTANTANÉ
+# -------------------------------
+class JournalProgressStore(_IndexedProgress):
+    """Progression sous forme de journal d'événements en ajout seul.
+
+    Chaque action (« answer », « hint », « adjust », « reset ») ajoute une
+    ligne JSON horodatée à ``progress.journal`` : une écriture coûte O(1) et
+    l'historique est conservé. L'index des équipes est une vue matérialisée
+    en mémoire, mise à jour en ne lisant que les octets ajoutés depuis la
+    dernière lecture.
+
+    Au-delà de ``compact_bytes``, la compaction écrit l'état courant dans
+    ``<journal>.snapshot`` et archive le journal sous ``<journal>.<n>`` : un
+    démarrage ne rejoue plus que l'instantané et les événements récents.
+    """
+
+    def __init__(self, path, game=DEFAULT_GAME, compact_bytes=None):
+        self.game = game
+        self.path = path = partition_path(path, game)
+        self.snapshot_path = path + ".snapshot"
+        self.lock_path = path + ".lock"
+        self.compact_bytes = compact_bytes or int(os.getenv("GAIA_JOURNAL_COMPACT_BYTES", 1_000_000))
+        self._thread_lock = threading.Lock()
+        self._state = {}
+        self._generation = -1
+        self._offset = 0
+        self._snapshot_stat = None
+        self._init_index()
+        with flock(self.lock_path):
+            open(self.path, "a").close()
+
+    def _reload_snapshot(self):
+        """Recharge l'instantané s'il a changé depuis la dernière lecture."""
+        stat = file_token(self.snapshot_path)
+        if stat == self._snapshot_stat and self._generation >= 0:
+            return
+        if stat is None:
+            generation, teams = 0, {}
+        else:
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            generation, teams = snapshot["generation"], {row["Team"]: row for row in snapshot["teams"]}
+        self._snapshot_stat = stat
+        if generation != self._generation:
+            self._state, self._generation, self._offset = teams, generation, 0
+
+    def _catch_up(self):
+        """Rattrape le journal ; à appeler sous verrou (partagé ou exclusif)."""
+        self._reload_snapshot()
+        with open(self.path, "rb") as journal:
+            journal.seek(self._offset)
+            chunk = journal.read()
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            if line:
+                _apply_event(self._state, json.loads(line))
+        self._offset += end
+
+    def _version_token(self):
+        return file_token(self.path), file_token(self.snapshot_path)
+
+    def _read_index(self):
+        # Rattrapage incrémental : seuls les octets ajoutés sont relus.
+        with self._thread_lock, flock(self.lock_path, exclusive=False):
+            self._catch_up()
+        return self._state
+
+    def _write_events(self, events):
+        lines = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events).encode("utf-8")
+        # Les ajouts se font sous verrou partagé (O_APPEND les sérialise) ;
+        # seule la compaction prend le verrou exclusif.
+        with flock(self.lock_path, exclusive=False):
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+            try:
+                os.write(fd, lines)
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+        if size > self.compact_bytes:
+            self.compact()
+
+    def compact(self):
+        """Replie le journal dans un nouvel instantané et archive l'ancien journal."""
+        with self._thread_lock, flock(self.lock_path):
+            self._catch_up()
+            if self._offset == 0:
+                return
+            generation = self._generation + 1
+            teams = list(self._state.values())
+            atomic_write(
+                self.snapshot_path,
+                lambda tmp: json.dump({"generation": generation, "teams": teams}, tmp, ensure_ascii=False),
+            )
+            self._snapshot_stat = file_token(self.snapshot_path)
+            os.replace(self.path, f"{self.path}.{generation}")
+            open(self.path, "a").close()
+            self._generation, self._offset = generation, 0
+
+
+# -------------------------------
+# ACCÈS PARTAGÉ
+# -------------------------------
+BACKENDS = {"sqlite": SQLiteProgressStore, "csv": CSVProgressStore, "journal": JournalProgressStore}
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def default_game():
+    return os.getenv("GAIA_GAME_ID", DEFAULT_GAME)
+
+
+def _backend_for(path):
+    """Backend correspondant à l'extension de ``path``, ou ``None``."""
+    extension = os.path.splitext(path or "")[1]
+    for backend, default in DEFAULT_PROGRESS_PATHS.items():
+        if extension == os.path.splitext(default)[1]:
+            return backend
+    return None
+
+
+def get_store(path=None, backend=None, game=None):
+    """Retourne le stockage d'une partie (un seul par backend, chemin et partie).
+
+    Sans ``GAIA_PROGRESS_BACKEND``, le backend suit l'extension de
+    ``GAIA_PROGRESS_PATH`` : un ancien ``GAIA_PROGRESS_PATH=progress.csv``
+    garde le stockage CSV. Un ``backend`` passé en argument (import vers
+    SQLite, compaction du journal) ignore un ``GAIA_PROGRESS_PATH`` dont
+    l'extension désigne un autre backend.
+    """
+    env_path = os.getenv("GAIA_PROGRESS_PATH")
+    if path is None and env_path and (backend is None or _backend_for(env_path) in (None, backend)):
+        path = env_path
+    backend = backend or os.getenv("GAIA_PROGRESS_BACKEND") or _backend_for(path) or "sqlite"
+    if backend not in BACKENDS:
+        raise ValueError(f"GAIA_PROGRESS_BACKEND inconnu : {backend!r} (attendu : {', '.join(BACKENDS)})")
+    game = game or default_game()
+    if not GAME_ID_PATTERN.fullmatch(game):
+        raise ValueError(f"Identifiant de partie invalide : {game!r} (lettres, chiffres, _ et - uniquement)")
+    path = path or DEFAULT_PROGRESS_PATHS[backend]
+    with _stores_lock:
+        store = _stores.get((backend, path, game))
+        if store is None:
+            store = _stores[(backend, path, game)] = BACKENDS[backend](path, game)
+        return store
+
+
+def load_progress(game=None):
+    return get_store(game=game).load()
+
+
+def get_team(team, game=None):
+    return get_store(game=game).get(team)
+
+
+def update_progress(team, mission, score, hint, game=None):
+    get_store(game=game).update_progress(team, mission, score, hint)
+
+
+def send_hint(team, hint, game=None):
+    get_store(game=game).send_hint(team, hint)
+
+
+def adjust_team(team, score, mission, game=None):
+    get_store(game=game).adjust(team, score, mission)
+
+
+def reset_progress(game=None):
+    """Réinitialise une seule partie ; les autres ne sont pas touchées."""
+    get_store(game=game).reset()
+
+
+def flush_progress(game=None):
+    """Vide la file d'écriture différée et attend que tout soit écrit."""
+    get_store(game=game).flush()
@@ -0,0 +1,63 @@
+# ===============================
+# 🎮 Opération Sauver Gaïa - Espace Équipe
+# ===============================
+# Fichier : gaia_core/team.py
+"""Déroulé des missions d'une équipe, commun aux deux pages Équipe."""
+
+import streamlit as st
+
+from gaia_core.answers import AnswerKeyError, expected_answer
+from gaia_core.missions import FIRST_MISSION, MISSIONS, submit_answer
+from gaia_core.progress import GAME_ID_PATTERN, default_game, get_team, update_progress
+
+
+def current_game():
+    """Partie de la page : ``?game=<id>`` dans l'URL, sinon ``GAIA_GAME_ID``."""
+    game = st.query_params.get("game") or default_game()
+    if not GAME_ID_PATTERN.fullmatch(game):
+        st.error("Identifiant de partie invalide (lettres, chiffres, _ et - uniquement).")
+        st.stop()
+    return game
+
+
+def render_team_space(team_name, show_objective, show_hint, game=None):
+    """Affiche la mission courante de ``team_name`` et retourne son score.
+
+    ``show_objective(texte)`` et ``show_hint(texte)`` laissent chaque page
+    garder sa propre mise en forme. Seule la partie ``game`` est lue et écrite.
+    """
+    team_state = get_team(team_name, game=game)
+
+    if team_state is not None:
+        current_mission = int(team_state["Mission"])
+        score = int(team_state["Score"])
+    else:
+        current_mission = FIRST_MISSION
+        score = 0
+        update_progress(team_name, current_mission, score, "", game=game)
+
+    st.header(f"🚀 Mission {current_mission}")
+
+    mission = MISSIONS.get(current_mission)
+    if mission is not None:
+        # Seules les missions corrigées sur le jeu de données en dépendent.
+        if mission.answer_key is not None:
+            try:
+                expected_answer(mission.answer_key)
+            except AnswerKeyError as exc:
+                st.error(f"Cette mission ne peut pas être validée sur ce jeu de données : {exc}")
+                st.stop()
+        show_objective(mission.objective)
+        answer = getattr(st, mission.widget)(mission.label, **mission.widget_kwargs())
+        if st.button(mission.button):
+            ok, current_mission, score = submit_answer(team_name, mission, score, answer, game=game)
+            if ok:
+                st.success(mission.success)
+            else:
+                getattr(st, mission.failure_level)(mission.failure)
+
+    team_state = get_team(team_name, game=game)
+    if team_state is not None:
+        show_hint(team_state["Hint"])
+
+    return score
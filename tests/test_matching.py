@@ -0,0 +1,51 @@
+"""Comparaison tolérante des réponses (``gaia_core.matching``).
+
+    python -m pytest -q
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gaia_core.matching import AnswerMatcher  # noqa: E402
+from gaia_core.missions import MISSIONS  # noqa: E402
+
+
+@pytest.mark.parametrize("answer", ["Archipel", "L'Archipel", "La région Archipel", "archipels", "ARCHIPEL !", "Arhcipel", "archipl"])
+def test_exact_accepts_variants_and_typos(answer):
+    assert AnswerMatcher(["archipel"])(answer)
+
+
+@pytest.mark.parametrize("answer", ["Nord", "Est", "archipel du sud", ""])
+def test_exact_rejects_other_answers(answer):
+    assert not AnswerMatcher(["archipel"])(answer)
+
+
+@pytest.mark.parametrize("answer", [
+    "relation inverse",
+    "ça baisse",
+    "BAÏSSE",
+    "les émissions baissent",
+    "inversement proportionnels",
+    "relation invrese",
+])
+def test_contains_accepts_keywords(answer):
+    assert MISSIONS[2].validate(answer)
+
+
+# Mots à une faute d'un mot-clé, mais sans rapport avec lui.
+@pytest.mark.parametrize("answer", [
+    "le co2 laisse place",
+    "la caisse",
+    "les deux sont basses",
+    "baise",
+    "l'univers",
+    "diverse",
+    "hausse",
+    "les deux augmentent",
+])
+def test_contains_rejects_unrelated_words(answer):
+    assert not MISSIONS[2].validate(answer)